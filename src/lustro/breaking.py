@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import os
@@ -8,23 +9,25 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from lustro.config import LustroConfig
+from lustro.config import LustroConfig, Source
 from lustro.fetcher import internalize_rss, internalize_web
 from lustro.log import append_to_log
-from lustro.state import lockfile
+from lustro.state import dumps_json, fsync_file, loads_json, lockfile
 
 ALERT_SIGNAL_LOG = Path.home() / ".cache" / "lustro" / "alert-signals.jsonl"
 
 MAX_ALERTS_PER_DAY = 3
 COOLDOWN_MINUTES = 60
 MAX_SEEN_IDS = 200
+MAX_FETCH_WORKERS = 8
 
-ENTITIES = re.compile(
-    r"(?i)\b("
+_ENTITY_PATTERN = (
+    r"\b(?:"
     r"anthropic|openai|open\s?ai|google\s?deepmind|deepmind|meta\s?ai|"
     r"mistral|x\.?ai|grok|"
     r"hkma|mas|sec|eu\s?ai\s?act|pboc|"
@@ -33,19 +36,18 @@ ENTITIES = re.compile(
     r"codex"
     r")\b"
 )
-ACTIONS = re.compile(
-    r"(?i)\b("
-    r"launch|launches|launched|"
-    r"release|releases|released|"
+_ACTION_PATTERN = (
+    r"\b(?:"
+    r"launch|release|"
     r"introduc|announc|unveil|"
     r"open.?sourc|"
     r"acquir|merg|shut.?down|"
     r"ban[s\b]|mandat|"
-    r"available|publishes|published|enters|entered"
+    r"available|publish(?:es|ed)|enter(?:s|ed)"
     r")"
 )
-NEGATIVE = re.compile(
-    r"(?i)\b("
+_NEGATIVE_PATTERN = (
+    r"\b(?:"
     r"partner|collaborat|"
     r"hiring|hire[sd]|recrui|"
     r"podcast|interview|webinar|"
@@ -53,6 +55,39 @@ NEGATIVE = re.compile(
     r")\b"
 )
 
+# Literal substrings, one of which must appear (lowercased) for the matching
+# pattern above to hit.  Checking them with ``in`` is far cheaper than a regex
+# scan and rejects almost every title before SIGNALS runs.
+ENTITY_LITERALS = (
+    "anthropic", "open", "deepmind", "meta", "mistral", "xai", "x.ai", "grok",
+    "hkma", "mas", "sec", "act", "pboc",
+    "gpt", "claude", "gemini", "llama",
+    "o1", "o2", "o3", "o4", "o5", "o6", "o7", "o8", "o9",
+    "sonnet", "opus", "haiku", "codex",
+)
+ACTION_LITERALS = (
+    "launch", "release", "introduc", "announc", "unveil", "sourc",
+    "acquir", "merg", "shut", "ban", "mandat",
+    "available", "publish", "enter",
+)
+NEGATIVE_LITERALS = (
+    "partner", "collaborat", "hiring", "hire", "recrui",
+    "podcast", "interview", "webinar", "round", "funding", "series",
+)
+
+# All three signals in one alternation so a title is scanned once.  Each
+# branch starts at a word boundary and no word can open two branches, so
+# non-overlapping finditer sees every signal separate searches would.  The
+# patterns are lowercase and run against ``title.lower()``, which avoids
+# per-character case folding in the matcher.
+SIGNALS = re.compile(
+    rf"(?P<neg>{_NEGATIVE_PATTERN})|(?P<ent>{_ENTITY_PATTERN})|(?P<act>{_ACTION_PATTERN})"
+)
+# Most titles contain no negative literal at all; scanning those with the
+# positive branches alone skips the negative alternation at every position.
+# The word-bounded pattern is still used when a literal is present, since
+# e.g. "partnership" must not count as "partner".
+POSITIVE_SIGNALS = re.compile(rf"(?P<ent>{_ENTITY_PATTERN})|(?P<act>{_ACTION_PATTERN})")
 
 BREAKING_FRESHNESS_HOURS = 2
 
@@ -80,18 +115,49 @@ def _article_is_fresh(
 
 
 def is_breaking(title: str) -> bool:
-    if not ENTITIES.search(title):
+    lowered = title.lower()
+    if not any(literal in lowered for literal in ENTITY_LITERALS):
         return False
-    if not ACTIONS.search(title):
+    if not any(literal in lowered for literal in ACTION_LITERALS):
         return False
-    if NEGATIVE.search(title):
+    has_entity = has_action = False
+    if not any(literal in lowered for literal in NEGATIVE_LITERALS):
+        # No veto possible, so the first entity+action pair settles it.
+        for match in POSITIVE_SIGNALS.finditer(lowered):
+            if match.lastgroup == "ent":
+                has_entity = True
+            else:
+                has_action = True
+            if has_entity and has_action:
+                return True
         return False
-    return True
+    for match in SIGNALS.finditer(lowered):
+        group = match.lastgroup
+        if group == "neg":
+            return False  # a negative signal vetoes the title; stop scanning
+        if group == "ent":
+            has_entity = True
+        else:
+            has_action = True
+    return has_entity and has_action
+
+
+# 64-bit BLAKE2b: same 16 hex chars as the old truncated SHA-256, cheaper per
+# call, and ample for a seen-set capped at MAX_SEEN_IDS.
+_blake2b_64 = functools.partial(hashlib.blake2b, digest_size=8)
 
 
 def article_hash(title: str, link: str, source: str) -> str:
-    raw = f"{title}|{link}|{source}"
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+    return _article_digest(title, link, b"|" + source.encode("utf-8"))
+
+
+def _article_digest(title: str, link: str, source_suffix: bytes) -> str:
+    """Hash ``title|link|source`` given the pre-encoded ``b"|" + source``."""
+    hasher = _blake2b_64(title.encode("utf-8"))
+    hasher.update(b"|")
+    hasher.update(link.encode("utf-8"))
+    hasher.update(source_suffix)
+    return hasher.hexdigest()
 
 
 def title_fingerprint(title: str) -> str:
@@ -106,11 +172,28 @@ def title_fingerprint(title: str) -> str:
     return hashlib.sha256(normalised.encode("utf-8")).hexdigest()[:16]
 
 
+# Known state keys in alphabetical order, so the saved file is byte-identical
+# to a sort_keys dump without sorting on every save.
+_STATE_KEYS = (
+    "alerts_today",
+    "last_alert_time",
+    "last_alert_ts",
+    "last_check",
+    "seen_ids",
+    "today_date",
+)
+_STATE_KEY_SET = frozenset(_STATE_KEYS)
+
+
 def load_breaking_state(path: Path, now: datetime) -> dict[str, Any]:
     if path.exists():
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = loads_json(path.read_bytes())
             if isinstance(payload, dict):
+                seen_ids = payload.get("seen_ids")
+                if not isinstance(seen_ids, list):
+                    seen_ids = []
+                payload["seen_ids"] = [value for value in seen_ids if isinstance(value, str)]
                 return payload
         except (OSError, json.JSONDecodeError):
             pass
@@ -120,22 +203,32 @@ def load_breaking_state(path: Path, now: datetime) -> dict[str, Any]:
         "alerts_today": 0,
         "today_date": now.date().isoformat(),
         "last_alert_time": None,
+        "last_alert_ts": None,
     }
 
 
 def save_breaking_state(path: Path, state: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(state, indent=2, sort_keys=True)
+    if state.keys() <= _STATE_KEY_SET:
+        ordered = {key: state[key] for key in _STATE_KEYS if key in state}
+        payload = dumps_json(ordered, indent=True)
+    else:
+        payload = dumps_json(state, indent=True, sort_keys=True)
     fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    replaced = False
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+        with os.fdopen(fd, "wb") as tmp_file:
             tmp_file.write(payload)
             tmp_file.flush()
-            os.fsync(tmp_file.fileno())
+            fsync_file(tmp_file)
         os.replace(tmp_name, path)
+        replaced = True
     finally:
-        if os.path.exists(tmp_name):
-            os.unlink(tmp_name)
+        if not replaced:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
 
 
 def reset_daily_counter(state: dict[str, Any], now: datetime) -> None:
@@ -148,6 +241,10 @@ def reset_daily_counter(state: dict[str, Any], now: datetime) -> None:
 def can_alert(state: dict[str, Any], now: datetime) -> bool:
     if int(state.get("alerts_today", 0)) >= MAX_ALERTS_PER_DAY:
         return False
+    last_ts = state.get("last_alert_ts")
+    if isinstance(last_ts, (int, float)) and not isinstance(last_ts, bool):
+        return now.timestamp() - last_ts >= COOLDOWN_MINUTES * 60
+    # Legacy state files only carry the ISO string.
     last = state.get("last_alert_time")
     if not last:
         return True
@@ -228,31 +325,32 @@ def append_alert_signal(
         fh.write(json.dumps(record, ensure_ascii=False) + "\n")
 
 
-def _source_candidates(cfg: LustroConfig) -> list[dict[str, Any]]:
-    web_sources = cfg.sources_data.get("web_sources", [])
-    if not isinstance(web_sources, list):
-        return []
-    return [
-        source
-        for source in web_sources
-        if isinstance(source, dict)
-        and int(source.get("tier", 2)) == 1
-        and (source.get("rss") or source.get("url"))
-    ]
+def _source_candidates(cfg: LustroConfig) -> list[Source]:
+    return cfg.tier1_web_sources
+
+
+def _fetch_source(source: Source, since_date: str) -> tuple[str, list[dict[str, str]]]:
+    if source.rss:
+        articles = internalize_rss(source.rss, since_date, max_items=10)
+        if articles is None and source.url:
+            articles = internalize_web(source.url, max_items=8)
+    else:
+        articles = internalize_web(source.url or "", max_items=8)
+    return source.name, articles or []
 
 
 def _send_alert(
     title: str,
     link: str,
     source: str,
-    now: datetime,
+    time_str: str,
     dry_run: bool,
     tg_notify_path: str | None = None,
 ) -> None:
     if link:
-        msg = f"🚨 *Breaking:* [{title}]({link})\nSource: {source} • {now.strftime('%H:%M')} UTC"
+        msg = f"🚨 *Breaking:* [{title}]({link})\nSource: {source} • {time_str} UTC"
     else:
-        msg = f"🚨 *Breaking:* {title}\nSource: {source} • {now.strftime('%H:%M')} UTC"
+        msg = f"🚨 *Breaking:* {title}\nSource: {source} • {time_str} UTC"
 
     if dry_run:
         print(f"[DRY RUN] {msg}", file=sys.stderr)
@@ -271,10 +369,10 @@ def _send_alert(
         print(f"Telegram error: {exc}", file=sys.stderr)
 
 
-def _append_breaking_log(cfg: LustroConfig, matches: list[dict[str, str]], now: datetime) -> None:
+def _append_breaking_log(cfg: LustroConfig, matches: list[dict[str, str]], date_str: str) -> None:
     if not matches:
         return
-    lines = [f"## {now.strftime('%Y-%m-%d')} (Breaking Alerts)\n", "### Breaking AI News\n"]
+    lines = [f"## {date_str} (Breaking Alerts)\n", "### Breaking AI News\n"]
     for match in matches:
         title = match["title"]
         link = match.get("link", "")
@@ -308,8 +406,8 @@ def _run_breaking_locked(
     state = load_breaking_state(state_path, now)
     reset_daily_counter(state, now)
 
-    seen_list = [str(value) for value in state.get("seen_ids", []) if isinstance(value, str)]
-    seen_set = set(seen_list)
+    # Insertion-ordered dict: O(1) membership and oldest-first order for truncation.
+    seen = dict.fromkeys(state["seen_ids"])
     # Cross-source dedup: tracks normalised title fingerprints within this run.
     # If two feeds carry the same story (same title, different source), only the
     # first occurrence fires an alert.
@@ -320,29 +418,32 @@ def _run_breaking_locked(
     matches: list[dict[str, str]] = []
     signal_log_path = ALERT_SIGNAL_LOG
     now_iso = now.isoformat()
-
-    print(f"[{now.strftime('%Y-%m-%d %H:%M')} UTC] Breaking news check", file=sys.stderr)
-
-    for source in _source_candidates(cfg):
-        source_name = str(source.get("name", "Unknown Source"))
-        if source.get("rss"):
-            articles = internalize_rss(str(source["rss"]), since_date, max_items=10)
-            if articles is None and source.get("url"):
-                articles = internalize_web(str(source["url"]), max_items=8)
-            articles = articles or []
-        else:
-            articles = internalize_web(str(source.get("url", "")), max_items=8)
-
+    date_str = now.strftime("%Y-%m-%d")
+    time_str = now.strftime("%H:%M")
+
+    print(f"[{date_str} {time_str} UTC] Breaking news check", file=sys.stderr)
+
+    # Fetches are network-bound, so run them concurrently; map() keeps source
+    # order so dedup and matching below stay deterministic.
+    candidates = _source_candidates(cfg)
+    fetched: list[tuple[str, list[dict[str, str]]]] = []
+    if candidates:
+        workers = min(MAX_FETCH_WORKERS, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetch = functools.partial(_fetch_source, since_date=since_date)
+            fetched = list(pool.map(fetch, candidates))
+
+    for source_name, articles in fetched:
+        source_suffix = b"|" + source_name.encode("utf-8")
         for article in articles:
             title = str(article.get("title", "")).strip()
             link = str(article.get("link", "")).strip()
             if not title:
                 continue
-            digest = article_hash(title, link, source_name)
-            if digest in seen_set:
+            digest = _article_digest(title, link, source_suffix)
+            if digest in seen:
                 continue
-            seen_set.add(digest)
-            seen_list.append(digest)
+            seen[digest] = None
             published_at = str(article.get("published_at", ""))
             age_mins = _age_minutes(published_at, now)
             breaking = is_breaking(title)
@@ -388,10 +489,11 @@ def _run_breaking_locked(
                     }
                 )
 
-    if len(seen_list) > MAX_SEEN_IDS:
-        seen_list = seen_list[-MAX_SEEN_IDS:]
+    seen_ids = list(seen)
+    if len(seen_ids) > MAX_SEEN_IDS:
+        seen_ids = seen_ids[-MAX_SEEN_IDS:]
 
-    state["seen_ids"] = seen_list
+    state["seen_ids"] = seen_ids
     state["last_check"] = now.isoformat()
 
     if not matches:
@@ -425,13 +527,14 @@ def _run_breaking_locked(
             match["title"],
             match.get("link", ""),
             match["source"],
-            now,
+            time_str,
             dry_run,
             tg_notify_path=cfg.tg_notify_path,
         )
         if not dry_run:
             state["alerts_today"] = int(state.get("alerts_today", 0)) + 1
-            state["last_alert_time"] = now.isoformat()
+            state["last_alert_time"] = now_iso
+            state["last_alert_ts"] = now.timestamp()
             sent_matches.append(match)
             append_alert_signal(
                 signal_log_path,
@@ -448,7 +551,7 @@ def _run_breaking_locked(
             )
 
     if not dry_run:
-        _append_breaking_log(cfg, sent_matches, now)
+        _append_breaking_log(cfg, sent_matches, date_str)
 
     save_breaking_state(state_path, state)
     return 0
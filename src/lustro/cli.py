@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import importlib.metadata
+import os
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -28,6 +28,8 @@ def main_callback(
 
 
 def _get_version() -> str:
+    import importlib.metadata
+
     try:
         return importlib.metadata.version("lustro")
     except importlib.metadata.PackageNotFoundError:
@@ -35,16 +37,18 @@ def _get_version() -> str:
 
 
 def _file_age(path: Path, now: datetime) -> str:
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return "missing"
-    modified = datetime.fromtimestamp(path.stat().st_mtime, tz=now.tzinfo)
-    delta = now - modified
-    if delta.total_seconds() < 60:
+    delta = now - datetime.fromtimestamp(st.st_mtime, tz=now.tzinfo)
+    seconds = delta.total_seconds()
+    if seconds < 60:
         return "just now"
-    if delta.total_seconds() < 3600:
-        return f"{int(delta.total_seconds() // 60)}m ago"
-    if delta.total_seconds() < 86400:
-        return f"{int(delta.total_seconds() // 3600)}h ago"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h ago"
     return f"{delta.days}d ago"
 
 
@@ -116,7 +120,7 @@ def fetch(
 def _fetch_locked(cfg: LustroConfig, no_archive: bool) -> None:
     state = load_state(cfg.state_path)
     from lustro.fetcher import (
-        archive_cargo,
+        archive_cargo_batch,
         internalize_json_api,
         internalize_linkedin,
         internalize_rss,
@@ -143,7 +147,7 @@ def _fetch_locked(cfg: LustroConfig, no_archive: bool) -> None:
     title_prefixes = load_title_prefixes(cfg.log_path)
     results: dict[str, list[dict[str, str]]] = {}
     failed_sources: list[str] = []
-    archived_count = 0
+    to_archive: list[tuple[dict[str, str], str, int]] = []
     bookmark_ids_to_clear: list[str] = []
     _nodriver_profile = Path(
         cfg.config_data.get(
@@ -189,6 +193,7 @@ def _fetch_locked(cfg: LustroConfig, no_archive: bool) -> None:
                 full_fetch=bool(source.get("full_fetch", False)),
                 stealth_fetch=bool(source.get("stealth_fetch", False)),
                 profile_dir=_nodriver_profile,
+                validators=state,
             )
             if articles is None:
                 if "url" in source:
@@ -235,7 +240,9 @@ def _fetch_locked(cfg: LustroConfig, no_archive: bool) -> None:
         for article in articles:
             if is_junk(article["title"]):
                 continue
-            prefix = _title_prefix(article["title"])
+            # Prefixes from the log are interned, so an interned lookup key
+            # usually resolves by identity instead of a full string compare.
+            prefix = sys.intern(_title_prefix(article["title"]))
             if prefix in title_prefixes:
                 continue
             new_articles.append(article)
@@ -254,11 +261,10 @@ def _fetch_locked(cfg: LustroConfig, no_archive: bool) -> None:
             article["talking_point"] = str(scores.get("talking_point", ""))
             log_affinity(article, scores)
 
-        if not no_archive:
-            for article in new_articles:
-                if article.get("link") and tier == 1:
-                    archive_cargo(article, name, tier, cfg.article_cache_dir, now)
-                    archived_count += 1
+        if not no_archive and tier == 1:
+            to_archive.extend(
+                (article, name, tier) for article in new_articles if article.get("link")
+            )
 
         if source.get("bookmarks"):
             for article in new_articles:
@@ -289,6 +295,9 @@ def _fetch_locked(cfg: LustroConfig, no_archive: bool) -> None:
                     err=True,
                 )
 
+    if to_archive:
+        archive_cargo_batch(to_archive, cfg.article_cache_dir, now)
+
     save_state(cfg.state_path, state)
     if failed_sources:
         typer.echo(f"Fetch errors ({len(failed_sources)}): {', '.join(failed_sources)}", err=True)
@@ -456,23 +465,19 @@ def sources(
     cfg = load_config()
     rows: list[tuple[str, str, int, str]] = []
 
-    web_sources = cfg.sources_data.get("web_sources", [])
-    if isinstance(web_sources, list):
-        for source in web_sources:
-            if not isinstance(source, dict):
-                continue
-            source_tier = int(source.get("tier", 2))
-            if tier is not None and source_tier != tier:
-                continue
-            source_type = "rss" if source.get("rss") else "web"
-            rows.append(
-                (
-                    str(source.get("name", "")),
-                    source_type,
-                    source_tier,
-                    str(source.get("cadence", "-")),
-                )
+    for source in cfg.web_sources:
+        source_tier = int(source.get("tier", 2))
+        if tier is not None and source_tier != tier:
+            continue
+        source_type = "rss" if source.get("rss") else "web"
+        rows.append(
+            (
+                str(source.get("name", "")),
+                source_type,
+                source_tier,
+                str(source.get("cadence", "-")),
             )
+        )
 
     x_accounts = cfg.sources_data.get("x_accounts", [])
     if isinstance(x_accounts, list):
@@ -573,21 +578,28 @@ def status() -> None:
     typer.echo(f"State file:    {_file_age(cfg.state_path, now)}")
     typer.echo(f"News log:      {_file_age(cfg.log_path, now)}")
 
-    state = load_state(cfg.state_path)
-    if state:
-        typer.echo(f"Sources:       {len(state)} tracked")
+    # "_"-prefixed keys hold bookkeeping (zero counts, feed validators), not sources.
+    fetched = {
+        name: ts for name, ts in load_state(cfg.state_path).items() if not name.startswith("_")
+    }
+    if fetched:
+        typer.echo(f"Sources:       {len(fetched)} tracked")
         latest = max(
-            (dt for ts in state.values() if isinstance(ts, str) for dt in [_parse_aware(ts)] if dt),
+            (dt for ts in fetched.values() if isinstance(ts, str) and (dt := _parse_aware(ts))),
             default=None,
         )
         if latest is not None:
             typer.echo(f"Last fetch:    {latest.strftime('%Y-%m-%d %H:%M')}")
 
-    if cfg.article_cache_dir.exists():
-        files = list(cfg.article_cache_dir.glob("*.json"))
-        size_kb = sum(f.stat().st_size for f in files) / 1024
-        typer.echo(f"Article cache: {len(files)} files, {size_kb:.0f} KB")
-    else:
+    try:
+        count, total = 0, 0
+        with os.scandir(cfg.article_cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    count += 1
+                    total += entry.stat().st_size
+        typer.echo(f"Article cache: {count} files, {total / 1024:.0f} KB")
+    except FileNotFoundError:
         typer.echo(f"Article cache: missing ({cfg.article_cache_dir})")
 
     if not cfg.sources_path.exists():
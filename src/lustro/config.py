@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import copy
+import functools
 import os
 import shutil
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 def _expand_path(value: str | Path) -> Path:
     return Path(value).expanduser().resolve()
@@ -32,7 +40,18 @@ def _load_yaml(path: Path) -> dict[str, Any]:
         return {}
     with path.open("r", encoding="utf-8") as fh:
         raw = fh.read()
-    data = yaml.safe_load(_expand_env_vars(raw)) or {}
+    # Callers may mutate the result, so hand out a copy of the cached parse.
+    return copy.deepcopy(_parse_yaml(_expand_env_vars(raw)))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_yaml(text: str) -> dict[str, Any]:
+    """Parse expanded YAML text, cached so repeat loads in one process skip the parser.
+
+    Keyed on the env-expanded text rather than file metadata, because the same
+    file can expand differently when ${VAR} values change.
+    """
+    data = yaml.load(text, Loader=_SafeLoader) or {}
     if not isinstance(data, dict):
         return {}
     return data
@@ -46,6 +65,27 @@ def default_sources_text() -> str:
     return default_sources_path().read_text(encoding="utf-8")
 
 
+@dataclass(slots=True, frozen=True)
+class Source:
+    """A web source entry with its fields resolved once at load time."""
+
+    name: str
+    tier: int
+    cadence: str
+    rss: str | None = None
+    url: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Source:
+        return cls(
+            name=sys.intern(str(data.get("name", "Unknown Source"))),
+            tier=int(data.get("tier", 2)),
+            cadence=str(data.get("cadence", "-")),
+            rss=str(data["rss"]) if data.get("rss") else None,
+            url=str(data["url"]) if data.get("url") else None,
+        )
+
+
 @dataclass(slots=True)
 class LustroConfig:
     config_dir: Path
@@ -62,23 +102,74 @@ class LustroConfig:
     tg_notify_path: str | None = None
     config_data: dict[str, Any] = field(default_factory=dict)
     sources_data: dict[str, Any] = field(default_factory=dict)
+    _sources: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _web_sources: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _tier1_web_sources: list[Source] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _resolved_tools: dict[str, str | None] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @property
+    def web_sources(self) -> list[dict[str, Any]]:
+        """Dict entries of ``web_sources``, computed once per config."""
+        if self._web_sources is None:
+            section = self.sources_data.get("web_sources", [])
+            if not isinstance(section, list):
+                section = []
+            self._web_sources = [item for item in section if isinstance(item, dict)]
+        return self._web_sources
+
+    @property
+    def tier1_web_sources(self) -> list[Source]:
+        """Tier-1 web sources with an RSS or page URL, computed once per config."""
+        if self._tier1_web_sources is None:
+            parsed = (Source.from_dict(item) for item in self.web_sources)
+            self._tier1_web_sources = [
+                source for source in parsed if source.tier == 1 and (source.rss or source.url)
+            ]
+        return self._tier1_web_sources
 
     @property
     def sources(self) -> list[dict[str, Any]]:
-        result: list[dict[str, Any]] = []
-        for section in self.sources_data.values():
-            if isinstance(section, list):
-                result.extend(item for item in section if isinstance(item, dict))
-        return result
+        """Dict entries from every source section, computed once per config."""
+        if self._sources is None:
+            result: list[dict[str, Any]] = []
+            for section in self.sources_data.values():
+                if isinstance(section, list):
+                    result.extend(item for item in section if isinstance(item, dict))
+            # Source names key the fetch state, dedup and log grouping; interning
+            # them once lets those dict lookups match by identity.
+            for item in result:
+                name = item.get("name")
+                if isinstance(name, str):
+                    item["name"] = sys.intern(name)
+            self._sources = result
+        return self._sources
 
     def resolve_bird(self) -> str | None:
-        """Resolve bird CLI path: config override, then PATH lookup."""
+        """Resolve bird CLI path: config override, then PATH lookup. Cached per config."""
+        if "bird" not in self._resolved_tools:
+            self._resolved_tools["bird"] = self._find_bird()
+        return self._resolved_tools["bird"]
+
+    def resolve_tg_notify(self) -> str | None:
+        """Resolve tg-notify.sh path: config override, then PATH lookup. Cached per config."""
+        if "tg-notify" not in self._resolved_tools:
+            self._resolved_tools["tg-notify"] = self._find_tg_notify()
+        return self._resolved_tools["tg-notify"]
+
+    def _find_bird(self) -> str | None:
         if self.bird_path:
             return self.bird_path if Path(self.bird_path).is_file() else None
         return shutil.which("bird")
 
-    def resolve_tg_notify(self) -> str | None:
-        """Resolve tg-notify.sh path: config override, then PATH lookup."""
+    def _find_tg_notify(self) -> str | None:
         if self.tg_notify_path:
             return self.tg_notify_path if Path(self.tg_notify_path).is_file() else None
         found = shutil.which("tg-notify.sh")
@@ -88,7 +179,20 @@ class LustroConfig:
         return str(fallback) if fallback.is_file() else None
 
 
-def load_config() -> LustroConfig:
+_DIR_ENV_VARS = (
+    "HOME",
+    "XDG_CONFIG_HOME",
+    "XDG_CACHE_HOME",
+    "XDG_DATA_HOME",
+    "LUSTRO_CONFIG_DIR",
+    "LUSTRO_CACHE_DIR",
+    "LUSTRO_DATA_DIR",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_dirs(_env_key: tuple[str | None, ...], _cwd: str) -> tuple[Path, Path, Path]:
+    """Resolve (config_dir, cache_dir, data_dir); cached per environment and cwd."""
     xdg_config = _xdg_base("XDG_CONFIG_HOME", ".config")
     xdg_cache = _xdg_base("XDG_CACHE_HOME", ".cache")
     xdg_data = _xdg_base("XDG_DATA_HOME", ".local/share")
@@ -96,6 +200,12 @@ def load_config() -> LustroConfig:
     config_dir = _env_path("LUSTRO_CONFIG_DIR", xdg_config / "lustro")
     cache_dir = _env_path("LUSTRO_CACHE_DIR", xdg_cache / "lustro")
     data_dir = _env_path("LUSTRO_DATA_DIR", xdg_data / "lustro")
+    return config_dir, cache_dir, data_dir
+
+
+def load_config() -> LustroConfig:
+    env_key = tuple(os.environ.get(name) for name in _DIR_ENV_VARS)
+    config_dir, cache_dir, data_dir = _resolve_dirs(env_key, os.getcwd())
 
     config_path = config_dir / "config.yaml"
     sources_path = config_dir / "sources.yaml"
@@ -107,10 +217,14 @@ def load_config() -> LustroConfig:
     if not sources_data:
         sources_data = _load_yaml(default_sources_path())
 
-    log_path_raw = config_data.get("log_path", str(data_dir / "news.md"))
-    log_path = _expand_path(str(log_path_raw))
-    digest_output_raw = config_data.get("digest_output_dir", str(data_dir / "digests"))
-    digest_output_dir = _expand_path(str(digest_output_raw))
+    # Defaults sit under the already-resolved data_dir; only user-supplied
+    # values need expanding and resolving.
+    log_path_raw = config_data.get("log_path")
+    log_path = _expand_path(str(log_path_raw)) if log_path_raw else data_dir / "news.md"
+    digest_output_raw = config_data.get("digest_output_dir")
+    digest_output_dir = (
+        _expand_path(str(digest_output_raw)) if digest_output_raw else data_dir / "digests"
+    )
     digest_model = str(config_data.get("digest_model", "google/gemini-3.1-flash"))
     bird_path = config_data.get("bird_path")
     tg_notify_path = config_data.get("tg_notify_path")
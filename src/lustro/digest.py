@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
 from lustro.config import LustroConfig
+from lustro.state import loads_json
 
 DEFAULT_THEME_COUNT = 8
+MAX_READ_WORKERS = 8
+# Below this many files, thread start-up costs more than the overlapped reads save.
+MIN_PARALLEL_READS = 4
+MAX_THEME_WORKERS = 8
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
 # Score thresholds for weekly digest secretion.
@@ -18,6 +26,30 @@ WEEKLY_TRANSCYTOSE_THRESHOLD = 7
 # Store: cargo retained in the endosome for later reference.
 WEEKLY_STORE_THRESHOLD = 5
 
+# News log line formats written by lustro.log.format_markdown.
+_DATE_RE = re.compile(r"^## (\d{4}-\d{2}-\d{2})")
+_SOURCE_RE = re.compile(r"^### (.+)")
+# - [★] **[title](link)** (banking_angle: ...) (date) — summary
+_ARTICLE_PATTERN = (
+    r"^- (?:\[★\] )?\*\*(?:\[([^\]]+)\]\(([^)]+)\)|([^*]+))\*\*"
+    r"(?:\s*\(banking_angle: ([^)]+)\))?"
+    r"(?:\s*\(([^)]*)\))?"
+    r"(?:\s*—\s*(.+))?"
+)
+_ARTICLE_RE = re.compile(_ARTICLE_PATTERN)
+# Byte-level twins for scanning ASCII-only lines without decoding them.  In
+# bytes patterns \s and \d are ASCII-only, so they only agree with the str
+# patterns on ASCII input; other lines go through the str patterns instead.
+_DATE_RE_B = re.compile(rb"^## (\d{4}-\d{2}-\d{2})")
+_SOURCE_RE_B = re.compile(rb"^### (.+)")
+_ARTICLE_RE_B = re.compile(_ARTICLE_PATTERN.encode("utf-8"))
+_ANCHOR_RE = re.compile(r"[^a-z0-9 ]")
+# ASCII-only equivalent of _ANCHOR_RE.sub("", ...).replace(" ", "-") in one pass.
+_ANCHOR_TABLE = str.maketrans(
+    {chr(c): None for c in range(128) if not (chr(c).islower() or chr(c).isdigit())} | {" ": "-"}
+)
+_WORD_RE = re.compile(r"\S+")
+
 
 def _resolve_month(month: str | None) -> str:
     if month:
@@ -52,22 +84,58 @@ def _llm_call(client: Any, model: str, system: str, user: str, max_tokens: int)
     return response.choices[0].message.content or ""
 
 
+def _read_json_file(path: str) -> Any:
+    try:
+        with open(path, "rb") as fh:
+            return loads_json(fh.read())
+    except (OSError, ValueError):
+        return None
+
+
 def load_archived_articles(article_cache_dir: Path, month: str) -> list[dict[str, Any]]:
-    if not article_cache_dir.exists():
+    try:
+        with os.scandir(article_cache_dir) as it:
+            names = sorted(
+                entry.name
+                for entry in it
+                if entry.name.startswith(month) and entry.name.endswith(".json")
+            )
+    except FileNotFoundError:
         return []
+    if not names:
+        return []
+    paths = [os.path.join(article_cache_dir, name) for name in names]
+    if len(paths) < MIN_PARALLEL_READS:
+        payloads = list(map(_read_json_file, paths))
+    else:
+        # File reads dominate; a thread pool overlaps them while map() keeps order.
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(paths))) as pool:
+            payloads = list(pool.map(_read_json_file, paths))
+
     articles: list[dict[str, Any]] = []
-    for path in sorted(article_cache_dir.glob(f"{month}*.json")):
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            continue
+    for name, payload in zip(names, payloads):
         if not isinstance(payload, dict):
             continue
-        payload["_file"] = path.name
+        payload["_file"] = name
         articles.append(payload)
     return articles
 
 
+def _match_log_line(
+    pattern_b: re.Pattern[bytes], pattern: re.Pattern[str], line: bytes
+) -> re.Match[bytes] | re.Match[str] | None:
+    """Match *line* with the bytes pattern, or with the str one if it is not ASCII."""
+    if line.isascii():
+        return pattern_b.match(line)
+    return pattern.match(line.decode("utf-8"))
+
+
+def _group_text(value: bytes | str | None) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value or ""
+
+
 def load_news_log_entries(log_path: Path, month: str) -> list[dict[str, str]]:
     if not log_path.exists():
         return []
@@ -75,40 +143,65 @@ def load_news_log_entries(log_path: Path, month: str) -> list[dict[str, str]]:
     entries: list[dict[str, str]] = []
     current_date = ""
     current_source = ""
-    for line in log_path.read_text(encoding="utf-8").splitlines():
-        date_match = re.match(r"^## (\d{4}-\d{2}-\d{2})", line)
-        if date_match:
-            current_date = date_match.group(1)
-            continue
-
-        source_match = re.match(r"^### (.+)", line)
-        if source_match:
-            current_source = source_match.group(1).strip()
-            continue
-
-        article_match = re.match(
-            r"^- (?:\[★\] )?\*\*(?:\[([^\]]+)\]\(([^)]+)\)|([^*]+))\*\*"
-            r"(?:\s*\(banking_angle: ([^)]+)\))?"
-            r"(?:\s*\(([^)]*)\))?"
-            r"(?:\s*—\s*(.+))?",
-            line,
-        )
-        if article_match and current_date.startswith(month):
-            title = (article_match.group(1) or article_match.group(3) or "").strip()
-            if not title:
+    in_month = False
+    # Stream the append-only log as bytes instead of materialising the whole
+    # text.  Cheap prefix checks keep the regexes off lines that cannot match,
+    # and ASCII lines only decode their captured groups.
+    with log_path.open("rb") as fh:
+        for line in fh:
+            line = line.rstrip(b"\r\n")
+            if line.startswith(b"## "):
+                date_match = _match_log_line(_DATE_RE_B, _DATE_RE, line)
+                if date_match:
+                    current_date = _group_text(date_match.group(1))
+                    in_month = current_date.startswith(month)
+                    continue
+
+            if line.startswith(b"### "):
+                source_match = _match_log_line(_SOURCE_RE_B, _SOURCE_RE, line)
+                if source_match:
+                    current_source = _group_text(source_match.group(1)).strip()
+                    continue
+
+            if not in_month or not line.startswith(b"- "):
                 continue
-            entries.append(
-                {
-                    "title": title,
-                    "source": current_source,
-                    "date": article_match.group(5) or current_date,
-                    "link": article_match.group(2) or "",
-                    "summary": article_match.group(6) or "",
-                }
-            )
+            article_match = _match_log_line(_ARTICLE_RE_B, _ARTICLE_RE, line)
+            if article_match:
+                title_raw = article_match.group(1) or article_match.group(3)
+                title = _group_text(title_raw).strip()
+                if not title:
+                    continue
+                date_raw, link_raw, summary_raw = article_match.group(5, 2, 6)
+                entries.append(
+                    {
+                        "title": title,
+                        "source": current_source,
+                        "date": _group_text(date_raw) or current_date,
+                        "link": _group_text(link_raw),
+                        "summary": _group_text(summary_raw),
+                    }
+                )
     return entries
 
 
+def _preview(text: str, max_words: int, max_chars: int | None = None) -> str:
+    """Equivalent to ``" ".join(text.split()[:max_words])[:max_chars]``.
+
+    Stops scanning once either limit is reached instead of splitting the
+    whole article.
+    """
+    words: list[str] = []
+    length = -1  # no separator before the first word
+    for match in itertools.islice(_WORD_RE.finditer(text), max_words):
+        word = match.group()
+        words.append(word)
+        length += len(word) + 1
+        if max_chars is not None and length >= max_chars:
+            break
+    joined = " ".join(words)
+    return joined if max_chars is None else joined[:max_chars]
+
+
 def _parse_theme_json(raw: str) -> list[dict[str, Any]]:
     text = raw.strip()
     if text.startswith("```"):
@@ -132,7 +225,7 @@ def identify_themes(
         text_preview = ""
         text = article.get("text")
         if isinstance(text, str) and text:
-            text_preview = " ".join(text.split()[:200])[:500]
+            text_preview = _preview(text, 200, 500)
         items.append(
             f"[{i}] {article.get('date', '')} | {article.get('source', '')}"
             f" | {article.get('title', '')}\n"
@@ -183,19 +276,20 @@ def synthesize_theme(
     articles: list[dict[str, Any]],
     log_entries: list[dict[str, str]],
 ) -> str:
-    all_items: list[dict[str, Any]] = [*articles, *log_entries]
-    selected: list[dict[str, Any]] = []
-    for raw_idx in theme.get("article_indices", []):
-        if not isinstance(raw_idx, int):
-            continue
-        if 0 <= raw_idx < len(all_items):
-            selected.append(all_items[raw_idx])
+    # Indices address articles followed by log entries (see identify_themes).
+    n_articles = len(articles)
+    n_items = n_articles + len(log_entries)
+    selected: list[dict[str, Any]] = [
+        articles[idx] if idx < n_articles else log_entries[idx - n_articles]
+        for idx in theme.get("article_indices") or []
+        if isinstance(idx, int) and 0 <= idx < n_items
+    ]
 
     context_parts: list[str] = []
     for item in selected:
         text = item.get("text")
         if isinstance(text, str) and text:
-            text_block = " ".join(text.split()[:3000])
+            text_block = _preview(text, 3000)
         else:
             text_block = str(item.get("summary", "(no text available)"))
         context_parts.append(
@@ -243,7 +337,11 @@ def write_digest(
     ]
     for i, theme in enumerate(themes, 1):
         name = str(theme.get("theme", f"Theme {i}"))
-        anchor = re.sub(r"[^a-z0-9 ]", "", name.lower()).replace(" ", "-")
+        lowered = name.lower()
+        if lowered.isascii():
+            anchor = lowered.translate(_ANCHOR_TABLE)
+        else:
+            anchor = _ANCHOR_RE.sub("", lowered).replace(" ", "-")
         lines.append(f"{i}. [{name}](#{anchor})")
 
     lines.extend(["", "---", ""])
@@ -318,12 +416,12 @@ def load_log_entries_since(log_path: Path, since_date: str) -> list[dict[str, st
     current_source = ""
 
     for line in log_path.read_text(encoding="utf-8").splitlines():
-        date_match = re.match(r"^## (\d{4}-\d{2}-\d{2})", line)
+        date_match = _DATE_RE.match(line)
         if date_match:
             current_date = date_match.group(1)
             continue
 
-        source_match = re.match(r"^### (.+)", line)
+        source_match = _SOURCE_RE.match(line)
         if source_match:
             current_source = source_match.group(1).strip()
             continue
@@ -331,14 +429,7 @@ def load_log_entries_since(log_path: Path, since_date: str) -> list[dict[str, st
         if current_date < since_date:
             continue
 
-        # Parse article line: - [★] **[title](link)** (banking_angle: ...) (date) — summary
-        article_match = re.match(
-            r"^- (?:\[★\] )?\*\*(?:\[([^\]]+)\]\(([^)]+)\)|([^*]+))\*\*"
-            r"(?:\s*\(banking_angle: ([^)]+)\))?"
-            r"(?:\s*\(([^)]*)\))?"
-            r"(?:\s*—\s*(.+))?",
-            line,
-        )
+        article_match = _ARTICLE_RE.match(line)
         if article_match:
             title = (article_match.group(1) or article_match.group(3) or "").strip()
             if not title:
@@ -592,10 +683,15 @@ def run_digest(
     if dry_run:
         return identified_themes, None
 
-    briefs = [
-        synthesize_theme(client, model_id, theme, articles, log_entries)
-        for theme in identified_themes
-    ]
+    # Each brief is an independent, slow LLM request; map() keeps theme order.
+    briefs: list[str] = []
+    if identified_themes:
+        synthesize = functools.partial(
+            synthesize_theme, client, model_id, articles=articles, log_entries=log_entries
+        )
+        workers = min(MAX_THEME_WORKERS, len(identified_themes))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            briefs = list(pool.map(synthesize, identified_themes))
     output_path = write_digest(
         output_dir=cfg.digest_output_dir,
         month=target_month,
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import json
+import functools
 import re
-import shutil
 import subprocess
 import sys
 from datetime import datetime, timezone
@@ -10,24 +9,67 @@ from typing import Any
 
 from lustro.config import LustroConfig
 from lustro.log import append_to_log
+from lustro.state import loads_json
 
+_WS_RE = re.compile(r"\s+")
+# A leading global flag group such as "(?s)", which can be rewritten as "(?s:...)".
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
 
-def _compile_keywords(patterns: list[str]) -> list[re.Pattern[str]]:
+
+def _compile_keywords(patterns: list[str]) -> re.Pattern[str] | tuple[re.Pattern[str], ...]:
+    """One combined pattern when that is safe, else the keywords compiled one by one."""
+    key = tuple(patterns)
+    return _combine_keywords(key) or _keyword_patterns(key)
+
+
+@functools.lru_cache(maxsize=8)
+def _keyword_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
     compiled: list[re.Pattern[str]] = []
     for pattern in patterns:
         try:
             compiled.append(re.compile(pattern, re.IGNORECASE))
         except re.error:
             continue
-    return compiled
+    return tuple(compiled)
+
+
+@functools.lru_cache(maxsize=8)
+def _combine_keywords(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile valid keywords into one alternation so each text is scanned once.
+
+    Each pattern is compiled on its own first so one bad keyword does not
+    disable the rest, and a leading global flag group becomes a scoped one.
+    Returns None when no keyword is valid or the alternation would change
+    what the keywords match: capture groups would be renumbered (breaking
+    backreferences) or clash by name.
+    """
+    compiled = _keyword_patterns(patterns)
+    if not compiled or any(regex.groups for regex in compiled):
+        return None
+    parts: list[str] = []
+    for regex in compiled:
+        flags = _GLOBAL_FLAGS_RE.match(regex.pattern)
+        if flags:
+            parts.append(f"(?{flags[1]}:{regex.pattern[flags.end():]})")
+        else:
+            parts.append(f"(?:{regex.pattern})")
+    try:
+        return re.compile("|".join(parts), re.IGNORECASE)
+    except re.error:
+        return None
 
 
-def matches_keywords(text: str, compiled_keywords: list[re.Pattern[str]]) -> bool:
+def matches_keywords(
+    text: str, compiled_keywords: re.Pattern[str] | tuple[re.Pattern[str], ...]
+) -> bool:
+    if isinstance(compiled_keywords, re.Pattern):
+        return compiled_keywords.search(text) is not None
     return any(regex.search(text) for regex in compiled_keywords)
 
 
 def _normalize_handle(value: str) -> str:
-    return value.lstrip("@").strip().lower()
+    # Interned so tracked/grouped lookups mostly resolve by identity.
+    return sys.intern(value.lstrip("@").strip().lower())
 
 
 def _extract_handle(tweet: dict[str, Any]) -> str:
@@ -45,7 +87,7 @@ def _extract_handle(tweet: dict[str, Any]) -> str:
 
 
 def _sample(text: str, limit: int = 100) -> str:
-    text = " ".join(text.split())
+    text = _WS_RE.sub(" ", text).strip()
     if len(text) <= limit:
         return text
     return text[: limit - 1].rstrip() + "…"
@@ -78,13 +120,15 @@ def run_discover(cfg: LustroConfig, count: int | None = None, bird_path: str | N
     keywords = discovery_cfg.get("keywords", [])
     if not isinstance(keywords, list):
         keywords = []
-    compiled = _compile_keywords([str(pattern) for pattern in keywords if isinstance(pattern, str)])
+    compiled_keywords = _compile_keywords(
+        [pattern for pattern in keywords if isinstance(pattern, str)]
+    )
 
     default_count = int(discovery_cfg.get("count", 50))
     tweet_count = int(count) if count is not None else default_count
     tweet_count = max(tweet_count, 1)
 
-    bird_cli = bird_path or shutil.which("bird")
+    bird_cli = bird_path or cfg.resolve_bird()
     if bird_cli is None:
         print("bird CLI not found - skipping X discovery", file=sys.stderr)
         return 0
@@ -93,7 +137,6 @@ def run_discover(cfg: LustroConfig, count: int | None = None, bird_path: str | N
         proc = subprocess.run(
             [bird_cli, "home", "-n", str(tweet_count), "--json"],
             capture_output=True,
-            text=True,
             timeout=45,
         )
     except subprocess.TimeoutExpired:
@@ -101,13 +144,14 @@ def run_discover(cfg: LustroConfig, count: int | None = None, bird_path: str | N
         return 1
 
     if proc.returncode != 0:
-        message = proc.stderr.strip() or "unknown error"
+        message = proc.stderr.decode("utf-8", "replace").strip() or "unknown error"
         print(f"bird home failed: {message}", file=sys.stderr)
         return 1
 
     try:
-        payload = json.loads(proc.stdout)
-    except json.JSONDecodeError as exc:
+        # Parse the raw bytes; orjson (when installed) skips the str decode.
+        payload = loads_json(proc.stdout)
+    except ValueError as exc:
         print(f"bird output parse error: {exc}", file=sys.stderr)
         return 1
     if not isinstance(payload, list):
@@ -115,34 +159,33 @@ def run_discover(cfg: LustroConfig, count: int | None = None, bird_path: str | N
         return 1
 
     x_accounts = cfg.sources_data.get("x_accounts", [])
-    tracked = set()
-    if isinstance(x_accounts, list):
-        for account in x_accounts:
-            if not isinstance(account, dict):
-                continue
-            handle = account.get("handle", "")
-            if isinstance(handle, str) and handle.strip():
-                tracked.add(_normalize_handle(handle))
+    if not isinstance(x_accounts, list):
+        x_accounts = []
+    tracked: set[str] = set()
+    for account in x_accounts:
+        if not isinstance(account, dict):
+            continue
+        handle = account.get("handle", "")
+        if isinstance(handle, str) and handle.strip():
+            tracked.add(_normalize_handle(handle))
 
     matched_count = 0
     grouped: dict[str, dict[str, Any]] = {}
-    for item in payload:
-        if not isinstance(item, dict):
-            continue
-        text = str(item.get("text", "")).strip()
-        if not text:
-            continue
-        if compiled and not matches_keywords(text, compiled):
-            continue
-        if not compiled:
-            continue
+    # With no usable keywords nothing can match, so skip the scan entirely.
+    if compiled_keywords:
+        for item in payload:
+            if not isinstance(item, dict):
+                continue
+            text = str(item.get("text", "")).strip()
+            if not text or not matches_keywords(text, compiled_keywords):
+                continue
 
-        matched_count += 1
-        handle = _extract_handle(item)
-        if not handle or handle in tracked:
-            continue
-        row = grouped.setdefault(handle, {"count": 0, "sample": _sample(text)})
-        row["count"] += 1
+            matched_count += 1
+            handle = _extract_handle(item)
+            if not handle or handle in tracked:
+                continue
+            row = grouped.setdefault(handle, {"count": 0, "sample": _sample(text)})
+            row["count"] += 1
 
     new_handles = sorted(
         [(handle, int(data["count"]), str(data["sample"])) for handle, data in grouped.items()],
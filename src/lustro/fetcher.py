@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import atexit
+import functools
 import hashlib
 import ipaddress
 import json
@@ -11,16 +12,18 @@ import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Mapping, MutableMapping
 from urllib.parse import urljoin, urlparse
 
 import feedparser
 import requests
-import trafilatura
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 # ---------------------------------------------------------------------------
 # Browser process leak guard
@@ -67,6 +70,24 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; Lustro/0.2; +https://github.com/terry-li-hm/lustro)"
 }
 
+# One pooled session per process keeps connections alive across sources that
+# share a host (Substack, Medium, ...), skipping repeat TCP + TLS handshakes.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_getaddrinfo(hostname: str) -> tuple[str, ...]:
+    """Resolve *hostname* to its IP addresses, memoized for the process lifetime.
+
+    Failed lookups raise and are therefore not cached.
+    """
+    addrs = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    return tuple(sockaddr[0] for _family, _type, _proto, _canonname, sockaddr in addrs)
+
 
 def _is_safe_url(url: str) -> bool:
     """Block URLs targeting private/reserved IP ranges (SSRF protection)."""
@@ -77,9 +98,8 @@ def _is_safe_url(url: str) -> bool:
         hostname = parsed.hostname
         if not hostname:
             return False
-        addrs = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
-        for _family, _type, _proto, _canonname, sockaddr in addrs:
-            ip = ipaddress.ip_address(sockaddr[0])
+        for addr in _cached_getaddrinfo(hostname):
+            ip = ipaddress.ip_address(addr)
             if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved:
                 return False
     except (socket.gaierror, ValueError, OSError):
@@ -88,10 +108,36 @@ def _is_safe_url(url: str) -> bool:
 
 
 TIMEOUT = 15
+# bs4 tree builder: lxml parses in C, several times faster than the
+# pure-Python "html.parser".
+HTML_PARSER = "lxml"
+
+_SENT_SPLIT_RE = re.compile(r"[.!?。！？]")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_TWEET_DATE_RE = re.compile(
+    r"(\w{3}) (\w{3}) +(\d{1,2}) \d{2}:\d{2}:\d{2} [+-]\d{4} (\d{4})\Z", re.ASCII
+)
+_WEEKDAYS = frozenset(("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"))
+_MONTHS = {
+    name: i
+    for i, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+    )
+}
 ARCHIVE_TIMEOUT = 10
+# Index pages list their headlines near the top; stop downloading past this.
+MAX_WEB_BYTES = 512_000
+# Article pages are read whole, up to trafilatura's own default download limit.
+MAX_ARCHIVE_BYTES = 20_000_000
+
+
+_FEED_DATE_FIELDS = ("published_parsed", "updated_parsed", "created_parsed")
 
 
 def _entry_get(entry: Any, key: str, default: Any = "") -> Any:
+    # feedparser entries are FeedParserDict, a dict subclass: skip the probing.
+    if isinstance(entry, dict):
+        return entry.get(key, default)
     if hasattr(entry, "get"):
         try:
             return entry.get(key, default)
@@ -101,10 +147,8 @@ def _entry_get(entry: Any, key: str, default: Any = "") -> Any:
 
 
 def _parse_feed_date(entry: Any) -> str:
-    for field in ("published_parsed", "updated_parsed", "created_parsed"):
-        parsed = getattr(entry, field, None)
-        if parsed is None:
-            parsed = _entry_get(entry, field, None)
+    for field in _FEED_DATE_FIELDS:
+        parsed = _entry_get(entry, field, None)
         if parsed:
             return f"{parsed.tm_year}-{parsed.tm_mon:02d}-{parsed.tm_mday:02d}"
     return ""
@@ -120,10 +164,8 @@ def _parse_feed_datetime(entry: Any) -> str:
     """
     import calendar
 
-    for field in ("published_parsed", "updated_parsed", "created_parsed"):
-        parsed = getattr(entry, field, None)
-        if parsed is None:
-            parsed = _entry_get(entry, field, None)
+    for field in _FEED_DATE_FIELDS:
+        parsed = _entry_get(entry, field, None)
         if parsed:
             try:
                 # calendar.timegm interprets struct_time as UTC
@@ -156,10 +198,13 @@ def _parse_feed_datetime(entry: Any) -> str:
 
 
 def _parse_tweet_date(date_str: str) -> str:
+    """Date part of a Twitter ``createdAt`` ("Tue Feb 24 10:00:00 +0000 2026")."""
+    m = _TWEET_DATE_RE.match(date_str) if isinstance(date_str, str) else None
+    if not m or m[1] not in _WEEKDAYS or m[2] not in _MONTHS:
+        return ""
     try:
-        dt = datetime.strptime(date_str, "%a %b %d %H:%M:%S %z %Y")
-        return dt.strftime("%Y-%m-%d")
-    except (ValueError, TypeError):
+        return date(int(m[4]), _MONTHS[m[2]], int(m[3])).isoformat()
+    except ValueError:
         return ""
 
 
@@ -167,9 +212,12 @@ def _extract_summary(entry: Any) -> str:
     summary = _entry_get(entry, "summary", "")
     if not summary:
         return ""
-    soup = BeautifulSoup(summary, "html.parser")
-    text = soup.get_text().replace("\n", " ").strip()
-    first = re.split(r"[.!?。！？]", text)[0].strip()
+    if "<" in summary or "&" in summary:
+        text = BeautifulSoup(summary, HTML_PARSER).get_text()
+    else:
+        text = summary  # plain text: nothing for the parser to strip or decode
+    text = text.replace("\n", " ").strip()
+    first = _SENT_SPLIT_RE.split(text, maxsplit=1)[0].strip()
     return first[:120]
 
 
@@ -345,7 +393,7 @@ def internalize_json_api(
         records_path: Tuple of keys to drill into the response to reach the list of records.
     """
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
+        resp = _SESSION.get(url, timeout=TIMEOUT)
         resp.raise_for_status()
         data = resp.json()
     except Exception as exc:
@@ -386,9 +434,29 @@ def internalize_rss(
     full_fetch: bool = False,
     stealth_fetch: bool = False,
     profile_dir: Path | None = None,
+    validators: MutableMapping[str, str] | None = None,
 ) -> list[dict[str, str]] | None:
+    """Fetch RSS entries published on or after *since_date*.
+
+    When *validators* is given (the fetch state), the feed's ETag and
+    Last-Modified values are stored in it under ``_etag:<url>`` and
+    ``_modified:<url>`` and sent back as a conditional GET on the next run; an
+    unchanged feed (HTTP 304) returns no articles without being parsed.
+    """
+    etag_key, modified_key = f"_etag:{url}", f"_modified:{url}"
     try:
-        feed = feedparser.parse(url, request_headers=HEADERS)
+        if validators is None:
+            feed = feedparser.parse(url, request_headers=HEADERS)
+        else:
+            feed = feedparser.parse(
+                url,
+                request_headers=HEADERS,
+                etag=validators.get(etag_key),
+                modified=validators.get(modified_key),
+            )
+            if getattr(feed, "status", None) == 304:
+                print(f"  RSS unchanged (HTTP 304): {url}", file=sys.stderr)
+                return []
 
         # Dead-feed detection
         status = getattr(feed, "status", None)
@@ -403,6 +471,16 @@ def internalize_rss(
         if not hasattr(feed, "entries"):
             return None
 
+        if validators is not None:
+            for key, value in (
+                (etag_key, getattr(feed, "etag", None)),
+                (modified_key, getattr(feed, "modified", None)),
+            ):
+                if isinstance(value, str) and value:
+                    validators[key] = value
+                else:
+                    validators.pop(key, None)
+
         articles: list[dict[str, str]] = []
         for entry in feed.entries[: max_items * 2]:
             title = str(_entry_get(entry, "title", "")).strip()
@@ -417,12 +495,12 @@ def internalize_rss(
             # Extract full article text from RSS content field if available
             # (e.g. Wechat2RSS proxies full article HTML in content[0].value)
             rss_text = ""
-            content_list = getattr(entry, "content", None) or _entry_get(entry, "content", [])
+            content_list = _entry_get(entry, "content", None) or []
             if content_list:
                 raw = content_list[0]
                 html = raw.get("value", "") if hasattr(raw, "get") else getattr(raw, "value", "")
                 if html:
-                    rss_text = BeautifulSoup(html, "html.parser").get_text(separator=" ").strip()
+                    rss_text = BeautifulSoup(html, HTML_PARSER).get_text(separator=" ").strip()
 
             if stealth_fetch and link and _is_safe_url(link):
                 try:
@@ -439,8 +517,7 @@ def internalize_rss(
                     print(f"  stealth_fetch: {link} [failed]", file=sys.stderr)
             elif full_fetch and link and _is_safe_url(link):
                 try:
-                    downloaded = trafilatura.fetch_url(link)
-                    extracted = trafilatura.extract(downloaded) if downloaded else None
+                    extracted = _download_text(link)
                     if extracted:
                         summary = extracted.strip().replace("\n", " ")
                         print(f"  full_fetch: {link} [{len(summary)} chars]", file=sys.stderr)
@@ -468,6 +545,37 @@ def internalize_rss(
         return []
 
 
+def _download_text(link: str) -> str | None:
+    """Download *link* on the pooled session and extract its main text."""
+    resp = _SESSION.get(link, timeout=ARCHIVE_TIMEOUT, stream=True)
+    try:
+        if resp.status_code != 200:
+            return None
+        raw = _read_capped(resp, MAX_ARCHIVE_BYTES)
+    finally:
+        resp.close()
+    if not raw:
+        return None
+    # trafilatura is slow to import and only needed when archiving or
+    # full-fetching, so `lustro breaking` and --no-archive runs never load it.
+    import trafilatura
+
+    # Only the body text is kept, so skip comment and table extraction.
+    return trafilatura.extract(raw, include_comments=False, include_tables=False)
+
+
+def _read_capped(resp: requests.Response, limit: int) -> bytes:
+    """Read at most about *limit* bytes from a streamed response body."""
+    chunks: list[bytes] = []
+    size = 0
+    for chunk in resp.iter_content(65536):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b"".join(chunks)
+
+
 def internalize_web(
     url: str,
     max_items: int = 5,
@@ -483,12 +591,16 @@ def internalize_web(
             )
             if html is None:
                 return []
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, HTML_PARSER)
             print(f"  stealth_web: {url} [{len(html)} chars]", file=sys.stderr)
         else:
-            resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            resp = _SESSION.get(url, timeout=TIMEOUT, stream=True)
+            try:
+                resp.raise_for_status()
+                raw = _read_capped(resp, MAX_WEB_BYTES)
+            finally:
+                resp.close()
+            soup = BeautifulSoup(raw, HTML_PARSER, from_encoding=resp.encoding)
 
         articles: list[dict[str, str]] = []
 
@@ -643,11 +755,25 @@ def unbookmark_tweets(tweet_ids: list[str], bird_path: str | None = None) -> Non
 
 
 def _slug(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", text.lower().strip())[:60].strip("-")
+    return _SLUG_RE.sub("-", text.lower().strip())[:60].strip("-")
 
 
 def _title_hash(title: str) -> str:
-    return hashlib.sha256(title.encode()).hexdigest()[:8]
+    # Part of archived filenames: changing the algorithm would orphan every
+    # existing archive entry, so only the hex conversion is trimmed.
+    return hashlib.sha256(title.encode()).digest()[:4].hex()
+
+
+def _archive_key(
+    article: Mapping[str, str], source_name: str, now: datetime
+) -> tuple[str, str, str]:
+    """Return (date_str, filename_prefix, filename) for an archived article."""
+    date_str = article.get("date") or now.strftime("%Y-%m-%d")
+    prefix = f"{date_str}_{_slug(source_name)}_"
+    return date_str, prefix, f"{prefix}{_title_hash(article.get('title', ''))}.json"
+
+
+_ARCHIVE_WRITE_LOCK = threading.Lock()
 
 
 def archive_cargo(
@@ -656,7 +782,14 @@ def archive_cargo(
     tier: int,
     cache_dir: Path,
     now: datetime | None = None,
+    existing: set[str] | None = None,
 ) -> None:
+    """Archive a tier-1 article's full text as JSON under *cache_dir*.
+
+    *existing* is an optional snapshot of filenames already in *cache_dir*;
+    batch callers pass it (after creating the directory) to skip a stat per
+    article.
+    """
     if tier != 1:
         return
     link = article.get("link", "")
@@ -665,14 +798,14 @@ def archive_cargo(
     if now is None:
         now = datetime.now(timezone.utc)
 
-    date_str = article.get("date") or now.strftime("%Y-%m-%d")
-    slug = _slug(source_name)
+    date_str, prefix, filename = _archive_key(article, source_name, now)
     title = article.get("title", "")
-    h = _title_hash(title)
-    filename = f"{date_str}_{slug}_{h}.json"
     filepath = cache_dir / filename
 
-    if filepath.exists():
+    if existing is not None:
+        if filename in existing:
+            return
+    elif filepath.exists():
         return
 
     if not _is_safe_url(link):
@@ -682,9 +815,7 @@ def archive_cargo(
     text = article.get("text") or None
     if not text:
         try:
-            downloaded = trafilatura.fetch_url(link)
-            if downloaded:
-                text = trafilatura.extract(downloaded)
+            text = _download_text(link)
         except Exception as exc:
             print(f"  Archive error {link}: {exc}", file=sys.stderr)
 
@@ -695,34 +826,92 @@ def archive_cargo(
         print(f"  Skipped (too short): {filename} [{status}]", file=sys.stderr)
         return
 
-    # Content-hash dedup: skip if identical text already archived for same date+source
-    content_hash = hashlib.md5(text.encode()).hexdigest()
-    prefix = f"{date_str}_{slug}_"
-    if cache_dir.exists():
-        for existing in cache_dir.glob(f"{prefix}*.json"):
-            try:
-                existing_data = json.loads(existing.read_text(encoding="utf-8"))
-                existing_text = existing_data.get("text") or ""
-                if hashlib.md5(existing_text.encode()).hexdigest() == content_hash:
-                    print(f"  Skipped (duplicate content): {filename}", file=sys.stderr)
-                    return
-            except (OSError, json.JSONDecodeError):
-                continue
+    # Downloads overlap across batch workers, but the dedup check and write are
+    # serialised so each archive_cargo call sees files written by the others.
+    with _ARCHIVE_WRITE_LOCK:
+        # Content-hash dedup: skip if identical text already archived for same date+source
+        content_hash = hashlib.md5(text.encode()).hexdigest()
+        if cache_dir.exists():
+            for other_path in cache_dir.glob(f"{prefix}*.json"):
+                try:
+                    other_data = json.loads(other_path.read_text(encoding="utf-8"))
+                    other_text = other_data.get("text") or ""
+                    if hashlib.md5(other_text.encode()).hexdigest() == content_hash:
+                        print(f"  Skipped (duplicate content): {filename}", file=sys.stderr)
+                        return
+                except (OSError, json.JSONDecodeError):
+                    continue
+
+        record = {
+            "title": title,
+            "date": date_str,
+            "source": source_name,
+            "tier": tier,
+            "link": link,
+            "summary": article.get("summary", ""),
+            "text": text,
+            "fetched_at": now.isoformat(),
+        }
+
+        if existing is None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+        )
+        print(f"  Archived: {filename} [{len(text)} chars]", file=sys.stderr)
+
 
-    record = {
-        "title": title,
-        "date": date_str,
-        "source": source_name,
-        "tier": tier,
-        "link": link,
-        "summary": article.get("summary", ""),
-        "text": text,
-        "fetched_at": now.isoformat(),
-    }
+# Archive downloads are network-bound; a small pool overlaps their latency.
+ARCHIVE_WORKERS = 4
 
+
+def archive_cargo_batch(
+    jobs: list[tuple[Mapping[str, str], str, int]],
+    cache_dir: Path,
+    now: datetime | None = None,
+    max_workers: int = ARCHIVE_WORKERS,
+) -> None:
+    """Archive (article, source_name, tier) jobs concurrently into *cache_dir*.
+
+    The directory is listed once up front, so articles that are already
+    archived are dropped before any download is scheduled.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
     cache_dir.mkdir(parents=True, exist_ok=True)
-    filepath.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
-    print(f"  Archived: {filename} [{len(text)} chars]", file=sys.stderr)
+    with os.scandir(cache_dir) as it:
+        existing = {entry.name for entry in it}
+    # Keyed by archive filename so two jobs for the same file never both download.
+    by_filename: dict[str, tuple[Mapping[str, str], str, int]] = {}
+    for job in jobs:
+        filename = _archive_key(job[0], job[1], now)[2]
+        if filename not in existing:
+            by_filename.setdefault(filename, job)
+    pending = list(by_filename.values())
+    if not pending:
+        return
+
+    def _archive(job: tuple[Mapping[str, str], str, int]) -> None:
+        article, source_name, tier = job
+        archive_cargo(article, source_name, tier, cache_dir, now, existing)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+        list(pool.map(_archive, pending))
+
+
+PROBE_WORKERS = 16
+
+
+def _probe(url: str) -> str:
+    """Return the HTTP status of ``url`` as text, or "T/O" / "ERR"."""
+    try:
+        resp = _SESSION.get(url, timeout=10, stream=True)
+        resp.close()
+        return str(resp.status_code)
+    except requests.Timeout:
+        return "T/O"
+    except Exception:
+        return "ERR"
 
 
 def check_receptors(
@@ -739,12 +928,20 @@ def check_receptors(
     print(f"\n{'Source':<36} {'T':>1} {'HTTP':>5} {'Last Scan':>12}", file=sys.stderr)
     print("-" * 58, file=sys.stderr)
 
+    # Probes are independent and network-bound: run them concurrently, then
+    # report in source order.
+    urls = [source.get("rss") or source.get("url", "") for source in sources]
+    targets = list(dict.fromkeys(url for url in urls if url))
+    codes: dict[str, str] = {}
+    if targets:
+        with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(targets))) as pool:
+            codes = dict(zip(targets, pool.map(_probe, targets)))
+
     broken: list[str] = []
     stale: list[str] = []
-    for source in sources:
+    for source, url in zip(sources, urls):
         name = source["name"][:35]
         tier = source.get("tier", 2)
-        url = source.get("rss") or source.get("url", "")
 
         last_str = state.get(source["name"], "")
         if last_str:
@@ -762,15 +959,7 @@ def check_receptors(
             print(f"{name:<36} {tier:>1} {'-':>5} {scan_col:>12}", file=sys.stderr)
             continue
 
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=10, stream=True)
-            resp.close()
-            code = str(resp.status_code)
-        except requests.Timeout:
-            code = "T/O"
-        except Exception:
-            code = "ERR"
-
+        code = codes[url]
         flag = ""
         if code not in ("200", "301", "302"):
             broken.append(source["name"])
@@ -846,7 +1035,7 @@ def check_receptors(
     wechat_sources = [s for s in sources if s.get("rss", "").startswith("http://localhost:8001")]
     if wechat_sources:
         try:
-            resp = requests.get("http://localhost:8001/", timeout=5)
+            resp = _SESSION.get("http://localhost:8001/", timeout=5)
             resp.close()
             w_status = str(resp.status_code)
         except Exception:
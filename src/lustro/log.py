@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import functools
 import os
 import re
 import sys
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterable
+
+from lustro.state import fsync_file
+
+_TITLE_STAR_RE = re.compile(r'\*\*["\u201c]?(?:\[)?(.+?)(?:\]\([^)]*\))?["\u201d]?\*\*')
+_TITLE_QUOTE_RE = re.compile(r'["\u201c]([^"\u201d]{15,})["\u201d]')
+_PUNCT_RE = re.compile(r"[^\w\s]")
+# Same deletions as _PUNCT_RE for ASCII text, done by str.translate.
+_ASCII_PUNCT_TABLE = {c: None for c in range(128) if _PUNCT_RE.match(chr(c))}
+_HEADING_RE_B = re.compile(rb"^## (\d{4}-\d{2}-\d{2})", re.MULTILINE)
 
 
 def load_title_prefixes(log_path: Path) -> set[str]:
@@ -13,33 +24,28 @@ def load_title_prefixes(log_path: Path) -> set[str]:
         return set()
 
     content = log_path.read_text(encoding="utf-8")
-    prefixes: set[str] = set()
+    # Two passes on purpose: a quoted phrase inside a bold title is a separate
+    # prefix, which a single alternation regex would skip over.
+    titles = {m.group(1).strip() for m in _TITLE_STAR_RE.finditer(content)}
+    titles.update(m.group(1).strip() for m in _TITLE_QUOTE_RE.finditer(content))
+    return {sys.intern(p) for p in map(_title_prefix, titles) if p}
 
-    for match in re.finditer(r'\*\*["\u201c]?(?:\[)?(.+?)(?:\]\([^)]*\))?["\u201d]?\*\*', content):
-        title = match.group(1).strip()
-        prefix = _title_prefix(title)
-        if prefix:
-            prefixes.add(prefix)
 
-    for match in re.finditer(r'["\u201c]([^"\u201d]{15,})["\u201d]', content):
-        prefix = _title_prefix(match.group(1).strip())
-        if prefix:
-            prefixes.add(prefix)
-    return prefixes
+def _strip_punct(text: str) -> str:
+    if text.isascii():
+        return text.translate(_ASCII_PUNCT_TABLE)
+    return _PUNCT_RE.sub("", text)
 
 
+@functools.lru_cache(maxsize=4096)
 def _title_prefix(title: str) -> str:
-    words = re.sub(r"[^\w\s]", "", title.lower()).split()
+    words = _strip_punct(title.lower()).split()
     sig = [w for w in words if len(w) > 2][:6]
     return " ".join(sig)
 
 
-def is_junk(title: str) -> bool:
-    norm = re.sub(r"[^\w\s]", "", title.lower()).strip()
-    if len(norm) < 15:
-        return True
-
-    junk = {
+_JUNK_TITLES = frozenset(
+    {
         "current accounts",
         "crypto investigations",
         "crypto compliance",
@@ -57,18 +63,35 @@ def is_junk(title: str) -> bool:
         "trending",
         "popular",
     }
-    return norm in junk or norm.startswith("量子位编辑")
+)
+_JUNK_PREFIXES = ("量子位编辑",)
+
+
+def is_junk(title: str) -> bool:
+    # ASCII lowercasing never lengthens text, so short titles can't normalise to 15+.
+    if len(title) < 15 and title.isascii():
+        return True
+    norm = _strip_punct(title.lower()).strip()
+    if len(norm) < 15:
+        return True
+    return norm in _JUNK_TITLES or norm.startswith(_JUNK_PREFIXES)
 
 
 def _atomic_write(path: Path, content: str) -> None:
     """Write file atomically via tempfile + fsync + os.replace."""
+    _atomic_write_parts(path, (content.encode("utf-8"),))
+
+
+def _atomic_write_parts(path: Path, parts: Iterable[bytes | memoryview]) -> None:
+    """Like _atomic_write, but streams pre-encoded chunks without joining them."""
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
-            tmp_file.write(content)
+        with os.fdopen(fd, "wb") as tmp_file:
+            for part in parts:
+                tmp_file.write(part)
             tmp_file.flush()
-            os.fsync(tmp_file.fileno())
+            fsync_file(tmp_file)
         os.replace(tmp_name, path)
     finally:
         if os.path.exists(tmp_name):
@@ -83,48 +106,68 @@ def _sanitize_text(text: str) -> str:
     return text
 
 
+def _render_article(article: dict[str, str]) -> str:
+    """Render one article as a markdown bullet line."""
+    date = article.get("date")
+    date_part = f" ({date})" if date else ""
+    raw_summary = article.get("summary")
+    summary_part = f" — {_sanitize_text(raw_summary)}" if raw_summary else ""
+    title = _sanitize_text(article.get("title", ""))
+    link = article.get("link")
+    title_part = f"[{title}]({link})" if link else title
+    if int(article.get("score", 0) or 0) < 7:
+        return f"- **{title_part}**{date_part}{summary_part}"
+    raw_angle = article.get("banking_angle")
+    banking_angle = _sanitize_text(raw_angle) if raw_angle else ""
+    banking_part = (
+        f" (banking_angle: {banking_angle})" if banking_angle and banking_angle != "N/A" else ""
+    )
+    return f"- [★] **{title_part}**{banking_part}{date_part}{summary_part}"
+
+
 def format_markdown(results: dict[str, list[dict[str, str]]], date_str: str) -> str:
     lines = [f"## {date_str} (Automated Daily Scan)\n"]
     for source, articles in results.items():
         if not articles:
             continue
         lines.append(f"### {source}\n")
-        for article in articles:
-            date_part = f" ({article['date']})" if article.get("date") else ""
-            raw_summary = article.get("summary", "")
-            summary_part = f" — {_sanitize_text(raw_summary)}" if raw_summary else ""
-            title = _sanitize_text(article.get("title", ""))
-            title_part = f"[{title}]({article['link']})" if article.get("link") else title
-            marker = "[★] " if int(article.get("score", 0) or 0) >= 7 else ""
-            banking_angle = _sanitize_text(article.get("banking_angle", ""))
-            banking_part = f" (banking_angle: {banking_angle})" if marker and banking_angle and banking_angle != "N/A" else ""
-            lines.append(f"- {marker}**{title_part}**{banking_part}{date_part}{summary_part}")
+        lines.extend(map(_render_article, articles))
         lines.append("")
     return "\n".join(lines)
 
 
+_LOG_MARKERS = (
+    b"<!-- News entries below, added by /lustro -->",
+    b"<!-- News entries below -->",
+)
+
+
 def append_to_log(log_path: Path, markdown: str) -> None:
-    markers = [
-        "<!-- News entries below, added by /lustro -->",
-        "<!-- News entries below -->",
-    ]
     if not log_path.exists():
         _atomic_write(log_path, markdown)
         return
 
-    content = log_path.read_text(encoding="utf-8")
-    marker = next((candidate for candidate in markers if candidate in content), None)
-    if marker is None:
-        content += f"\n\n{markdown}"
-        _atomic_write(log_path, content)
+    # Work on the raw bytes and splice the new entry in with memoryview slices,
+    # so the existing log is never decoded or copied into a new string.
+    content = log_path.read_bytes()
+    view = memoryview(content)
+    new = markdown.encode("utf-8")
+    for marker in _LOG_MARKERS:
+        start = content.find(marker)
+        if start != -1:
+            break
+    else:
+        _atomic_write_parts(log_path, (view, b"\n\n", new))
         return
 
-    before, _, after = content.partition(marker)
-    suffix = after.lstrip("\n")
-    content = f"{before}{marker}\n\n{markdown}"
-    if suffix:
-        content = f"{content}\n{suffix}"
-    _atomic_write(log_path, content)
+    end = start + len(marker)
+    resume = end
+    while content[resume : resume + 1] == b"\n":
+        resume += 1
+    parts = [view[:end], b"\n\n", new]
+    if resume < len(content):
+        parts += [b"\n", view[resume:]]
+    _atomic_write_parts(log_path, parts)
 
 
 def rotate_log(
@@ -139,39 +182,42 @@ def rotate_log(
     if not log_path.exists():
         return
 
-    content = log_path.read_text(encoding="utf-8")
-    lines = content.splitlines()
-    if len(lines) <= max_lines:
+    content = log_path.read_bytes()
+    total_lines = content.count(b"\n") + (0 if content.endswith(b"\n") or not content else 1)
+    if total_lines <= max_lines:
         return
 
-    cutoff = (now - timedelta(days=14)).strftime("%Y-%m-%d")
-    keep_from = None
-    for i, line in enumerate(lines):
-        match = re.match(r"^## (\d{4}-\d{2}-\d{2})", line)
-        if match and match.group(1) <= cutoff:
-            keep_from = i
-            break
-
+    cutoff = (now - timedelta(days=14)).strftime("%Y-%m-%d").encode()
+    keep_from = next(
+        (m.start() for m in _HEADING_RE_B.finditer(content) if m.group(1) <= cutoff), None
+    )
     if keep_from is None:
         return
 
-    marker_line = next((i for i, line in enumerate(lines) if "<!-- News entries below" in line), 0)
-    header = lines[: marker_line + 1]
-    recent = lines[marker_line + 1 : keep_from]
-    old = lines[keep_from:]
+    marker = content.find(b"<!-- News entries below")
+    header_end = content.find(b"\n", max(marker, 0))
+    header_end = len(content) if header_end == -1 else header_end + 1
+    kept = memoryview(content)[: max(header_end, keep_from)]
+    old = memoryview(content)[keep_from:]
+    # keep_from sits at a line start, so newline counts are line counts.
+    old_lines = total_lines - content.count(b"\n", 0, keep_from)
+    recent_lines = content.count(b"\n", header_end, keep_from) if keep_from > header_end else 0
 
     month = now.strftime("%Y-%m")
     archive_name = f"{log_path.stem} - Archive {month}.md"
     archive_path = archive_dir / archive_name
     archive_dir.mkdir(parents=True, exist_ok=True)
-    mode = "a" if archive_path.exists() else "w"
-    with archive_path.open(mode, encoding="utf-8") as fh:
-        if mode == "w":
-            fh.write(f"# {log_path.stem} Archive - {month}\n\n")
-        fh.write("\n".join(old) + "\n")
-
-    _atomic_write(log_path, "\n".join(header + recent) + "\n")
+    mode = "ab" if archive_path.exists() else "wb"
+    with archive_path.open(mode) as fh:
+        if mode == "wb":
+            fh.write(f"# {log_path.stem} Archive - {month}\n\n".encode())
+        fh.write(old)
+        if not content.endswith(b"\n"):
+            fh.write(b"\n")
+
+    _atomic_write_parts(log_path, (kept, b"" if kept[-1:] == b"\n" else b"\n"))
     print(
-        f"Rotated: archived {len(old)} lines to {archive_path.name}, kept {len(recent)} lines.",
+        f"Rotated: archived {old_lines} lines to {archive_path.name}, "
+        f"kept {recent_lines} lines.",
         file=sys.stderr,
     )
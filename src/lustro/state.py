@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import fcntl
+import functools
 import json
 import os
 import sys
@@ -9,7 +10,38 @@ import tempfile
 from collections.abc import Generator
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Mapping
+from typing import IO, Any, Mapping
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install 'lustro[fast]'
+    orjson = None
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON with orjson when installed, else the stdlib parser."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes with orjson when installed, else the stdlib encoder."""
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    text = json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def fsync_file(fh: IO[Any]) -> None:
+    """fsync *fh* unless disabled with ``LUSTRO_FSYNC=0``."""
+    if os.environ.get("LUSTRO_FSYNC", "1") != "0":
+        os.fsync(fh.fileno())
 
 
 @contextlib.contextmanager
@@ -45,13 +77,13 @@ def load_state(path: Path) -> dict[str, str]:
     if not path.exists():
         return {}
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        data = loads_json(path.read_bytes())
+    except (OSError, ValueError):
         return {}
     if not isinstance(data, dict):
         return {}
     return {
-        str(key): str(value)
+        sys.intern(key): value
         for key, value in data.items()
         if isinstance(key, str) and isinstance(value, str)
     }
@@ -59,19 +91,36 @@ def load_state(path: Path) -> dict[str, str]:
 
 def save_state(path: Path, state: Mapping[str, str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(dict(state), indent=2, sort_keys=True)
+    payload = dumps_json(dict(state), indent=True, sort_keys=True)
     fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+        with os.fdopen(fd, "wb") as tmp_file:
             tmp_file.write(payload)
             tmp_file.flush()
-            os.fsync(tmp_file.fileno())
+            fsync_file(tmp_file)
         os.replace(tmp_name, path)
     finally:
         if os.path.exists(tmp_name):
             os.unlink(tmp_name)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+_US_PER_DAY = 86_400_000_000
+
+
+@functools.lru_cache(maxsize=1024)
+def _iso_to_epoch_us(value: str) -> int | None:
+    """Exact microseconds since the epoch for an ISO timestamp (naive means UTC)."""
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_US
+
+
 def refractory_elapsed(
     state: Mapping[str, str],
     source_name: str,
@@ -101,12 +150,9 @@ def refractory_elapsed(
     last_seen_raw = state.get(source_name)
     if not last_seen_raw:
         return True
-    try:
-        last_seen = datetime.fromisoformat(last_seen_raw)
-    except ValueError:
+    last_seen_us = _iso_to_epoch_us(last_seen_raw)
+    if last_seen_us is None:
         return True
     if now is None:
         now = datetime.now(timezone.utc)
-    if last_seen.tzinfo is None:
-        last_seen = last_seen.replace(tzinfo=timezone.utc)
-    return now - last_seen >= timedelta(days=cadence_days)
+    return (now - _EPOCH) // _ONE_US - last_seen_us >= cadence_days * _US_PER_DAY
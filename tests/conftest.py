@@ -1,10 +1,23 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
 
 import pytest
 import yaml
 
+# libyaml-backed dumper when available, same as the loader lustro.config uses.
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _dump_yaml(data: Any) -> str:
+    return yaml.dump(data, Dumper=_YamlDumper)
+
+
+@pytest.fixture
+def dump_yaml() -> Callable[[Any], str]:
+    return _dump_yaml
+
 
 @pytest.fixture
 def xdg_env(monkeypatch: pytest.MonkeyPatch, tmp_path):
@@ -49,5 +62,5 @@ def write_sources_file(xdg_env, sample_sources):
     config_home, _, _ = xdg_env
     target = config_home / "lustro" / "sources.yaml"
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(yaml.safe_dump(sample_sources), encoding="utf-8")
+    target.write_text(_dump_yaml(sample_sources), encoding="utf-8")
     return target
@@ -5,7 +5,15 @@ from datetime import datetime, timedelta, timezone
 
 import yaml
 
-from lustro.breaking import can_alert, is_breaking, reset_daily_counter, run_breaking, title_fingerprint
+from lustro.breaking import (
+    can_alert,
+    is_breaking,
+    load_breaking_state,
+    reset_daily_counter,
+    run_breaking,
+    save_breaking_state,
+    title_fingerprint,
+)
 from lustro.config import load_config
 
 
@@ -44,6 +52,15 @@ def test_is_breaking_codex_entity():
     assert is_breaking("A new legal statute entered the books today") is False
 
 
+def test_is_breaking_single_scan_sees_every_signal():
+    # A negative signal after both positives still blocks the alert
+    assert is_breaking("OpenAI launches agents after Series B funding") is False
+    # An entity that consumes a trailing space does not hide the action after it
+    assert is_breaking("o3 launches for enterprise customers") is True
+    # Order of signals in the title does not matter
+    assert is_breaking("Launched today: Claude 4 Opus") is True
+
+
 def test_title_fingerprint_cross_source_dedup():
     # Same title → same fingerprint
     fp1 = title_fingerprint("OpenAI launches GPT-5 family")
@@ -133,6 +150,13 @@ def test_state_counter_reset_and_cooldown():
     state["alerts_today"] = 3
     assert can_alert(state, now) is False
 
+    # The numeric timestamp takes precedence over the legacy ISO string
+    state["alerts_today"] = 1
+    state["last_alert_ts"] = (now - timedelta(minutes=30)).timestamp()
+    assert can_alert(state, now) is False
+    state["last_alert_ts"] = (now - timedelta(minutes=61)).timestamp()
+    assert can_alert(state, now) is True
+
 
 def test_cmd_breaking_dry_run(monkeypatch, xdg_env, capsys):
     config_home, _, _ = xdg_env
@@ -184,3 +208,32 @@ def test_cmd_breaking_dry_run(monkeypatch, xdg_env, capsys):
     state = json.loads(state_path.read_text(encoding="utf-8"))
     assert len(state["seen_ids"]) == 2
     assert cfg.log_path.exists() is False
+
+
+def test_load_breaking_state_drops_invalid_seen_ids(tmp_path):
+    now = datetime(2026, 2, 24, 10, 0, tzinfo=timezone.utc)
+    path = tmp_path / "breaking-state.json"
+    path.write_text(json.dumps({"seen_ids": ["a", 1, None, "b"]}), encoding="utf-8")
+    assert load_breaking_state(path, now)["seen_ids"] == ["a", "b"]
+
+    path.write_text(json.dumps({"seen_ids": "abc"}), encoding="utf-8")
+    assert load_breaking_state(path, now)["seen_ids"] == []
+
+
+def test_save_breaking_state_key_order_matches_sorted_dump(tmp_path):
+    path = tmp_path / "breaking-state.json"
+    state = {
+        "today_date": "2026-02-24",
+        "seen_ids": ["a"],
+        "last_check": None,
+        "alerts_today": 1,
+        "last_alert_time": None,
+    }
+    save_breaking_state(path, state)
+    assert path.read_text(encoding="utf-8") == json.dumps(
+        state, indent=2, sort_keys=True, ensure_ascii=False
+    )
+
+    state["extra"] = True
+    save_breaking_state(path, state)
+    assert list(json.loads(path.read_text(encoding="utf-8"))) == sorted(state)
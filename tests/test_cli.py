@@ -1,23 +1,24 @@
 from __future__ import annotations
 
-import pytest
-import yaml
 from typer.testing import CliRunner
 
-from lustro.cli import app
+from lustro.cli import _get_version, app
+from lustro.config import load_config
+from lustro.state import save_state
 
 
-@pytest.mark.skip(reason="CLI refactored to Typer, build_parser no longer exists")
 def test_version_flag():
-    pass
+    result = CliRunner().invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert result.output.strip() == f"lustro {_get_version()}"
 
 
-def test_cmd_sources_lists_and_filters_tier(xdg_env, capsys):
+def test_cmd_sources_lists_and_filters_tier(xdg_env, dump_yaml, capsys):
     config_home, _, _ = xdg_env
     sources_path = config_home / "lustro" / "sources.yaml"
     sources_path.parent.mkdir(parents=True, exist_ok=True)
     sources_path.write_text(
-        yaml.safe_dump(
+        dump_yaml(
             {
                 "web_sources": [
                     {"name": "Feed 1", "tier": 1, "cadence": "daily", "rss": "https://a/feed"},
@@ -48,3 +49,21 @@ def test_cmd_sources_lists_and_filters_tier(xdg_env, capsys):
     assert "Alice" in result_tier1.output
     assert "Site 2" not in result_tier1.output
     assert "Bob" not in result_tier1.output
+
+
+def test_status_counts_only_source_timestamps(write_sources_file):
+    cfg = load_config()
+    save_state(
+        cfg.state_path,
+        {
+            "Feed 1": "2026-02-24T10:00:00+00:00",
+            "_etag:https://a/feed": '"v1"',
+            "_modified:https://a/feed": "Tue, 24 Feb 2026 10:00:00 GMT",
+            "_zeros:Site 2": "3",
+        },
+    )
+
+    result = CliRunner().invoke(app, ["status"])
+    assert result.exit_code == 0
+    assert "Sources:       1 tracked" in result.output
+    assert "Last fetch:" in result.output
@@ -63,7 +63,7 @@ def test_fetch_fallback_and_zeros(monkeypatch, mock_cfg, capsys):
     monkeypatch.setattr("lustro.log.is_junk", lambda _t: False)
     monkeypatch.setattr("lustro.log.format_markdown", lambda *args: "# News")
     monkeypatch.setattr("lustro.log.append_to_log", lambda *args: None)
-    monkeypatch.setattr("lustro.fetcher.archive_cargo", lambda *args: None)
+    monkeypatch.setattr("lustro.fetcher.archive_cargo_batch", lambda *args, **kwargs: None)
 
     # Run once for fallback success
     _call_fetch_locked(mock_cfg, no_archive=True)
@@ -75,7 +75,7 @@ def test_fetch_fallback_and_zeros(monkeypatch, mock_cfg, capsys):
     monkeypatch.setattr("lustro.fetcher.internalize_web", lambda _url, **kwargs: [])
 
     # Run 5 times to see the warning
-    for i in range(5):
+    for _ in range(5):
         _call_fetch_locked(mock_cfg, no_archive=True)
     
     stderr = capsys.readouterr().err
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from lustro.config import load_config
+from lustro.config import Source, load_config
 
 
 def test_xdg_paths(xdg_env):
@@ -34,3 +34,48 @@ def test_sources_loaded_from_user_file(write_sources_file):
     cfg = load_config()
     assert len(cfg.sources) == 1
     assert cfg.sources[0]["name"] == "Test Feed"
+
+
+def test_tier1_web_sources_parsed_once(write_sources_file):
+    cfg = load_config()
+    tier1 = cfg.tier1_web_sources
+    assert tier1 == [
+        Source(
+            name="Test Feed",
+            tier=1,
+            cadence="daily",
+            rss="https://example.com/feed.xml",
+            url="https://example.com",
+        )
+    ]
+    assert cfg.tier1_web_sources is tier1
+
+
+def test_load_config_returns_independent_sources(write_sources_file):
+    first = load_config()
+    first.sources_data["web_sources"][0]["name"] = "Mutated"
+    second = load_config()
+    assert second.sources[0]["name"] == "Test Feed"
+
+
+def test_load_config_sees_sources_file_changes(write_sources_file, dump_yaml):
+    assert load_config().sources[0]["name"] == "Test Feed"
+    write_sources_file.write_text(
+        dump_yaml({"web_sources": [{"name": "Changed Feed", "tier": 2}]}),
+        encoding="utf-8",
+    )
+    assert load_config().sources[0]["name"] == "Changed Feed"
+
+
+def test_resolve_bird_is_cached_per_config(monkeypatch, xdg_env):
+    calls = []
+
+    def fake_which(name):
+        calls.append(name)
+        return "/usr/local/bin/bird"
+
+    monkeypatch.setattr("lustro.config.shutil.which", fake_which)
+    cfg = load_config()
+    assert cfg.resolve_bird() == "/usr/local/bin/bird"
+    assert cfg.resolve_bird() == "/usr/local/bin/bird"
+    assert calls == ["bird"]
@@ -11,40 +11,46 @@ from lustro.config import load_config
 from lustro.digest import (
     _resolve_week_label,
     create_openai_client,
+    load_archived_articles,
     load_log_entries_since,
+    load_news_log_entries,
     run_digest,
     run_weekly_digest,
     write_weekly_digest,
 )
 
-
-def _write_month_data(cfg, month: str):
-    cfg.article_cache_dir.mkdir(parents=True, exist_ok=True)
-    article = {
+# Serialised once; "{MONTH}" is substituted per test.
+_ARTICLE_JSON_TEMPLATE = json.dumps(
+    {
         "title": "Agent frameworks harden for enterprise adoption",
-        "date": f"{month}-24",
+        "date": "{MONTH}-24",
         "source": "Example Source",
         "summary": "A short summary",
         "link": "https://example.com/post",
         "text": "Full text body for clustering.",
     }
+)
+_LOG_TEMPLATE = (
+    "\n".join(
+        [
+            "## {MONTH}-24 (Automated Daily Scan)",
+            "### Example Log Source",
+            "- [★] **[AI regulation update](https://example.com/reg)**"
+            " (banking_angle: Material for bank governance discussions)"
+            " (2026-02-24) — New policy activity",
+        ]
+    )
+    + "\n"
+)
+
+
+def _write_month_data(cfg, month: str):
+    cfg.article_cache_dir.mkdir(parents=True, exist_ok=True)
     path = cfg.article_cache_dir / f"{month}-24_example_abc12345.json"
-    path.write_text(json.dumps(article), encoding="utf-8")
+    path.write_bytes(_ARTICLE_JSON_TEMPLATE.replace("{MONTH}", month).encode("utf-8"))
 
     cfg.log_path.parent.mkdir(parents=True, exist_ok=True)
-    cfg.log_path.write_text(
-        "\n".join(
-            [
-                f"## {month}-24 (Automated Daily Scan)",
-                "### Example Log Source",
-                "- [★] **[AI regulation update](https://example.com/reg)**"
-                " (banking_angle: Material for bank governance discussions)"
-                " (2026-02-24) — New policy activity",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
+    cfg.log_path.write_bytes(_LOG_TEMPLATE.replace("{MONTH}", month).encode("utf-8"))
 
 
 class _FakeOpenAIClient:
@@ -250,6 +256,52 @@ def test_load_log_entries_since_filters_by_date(xdg_env):
     assert entries[0]["title"] == "New article"
 
 
+def test_load_archived_articles_filters_by_month_prefix(tmp_path):
+    (tmp_path / "2026-03-02_b_2.json").write_bytes(b'{"title": "March B"}')
+    (tmp_path / "2026-03-01_a_1.json").write_bytes(b'{"title": "March A"}')
+    (tmp_path / "2026-02-28_a_0.json").write_bytes(b'{"title": "February"}')
+    (tmp_path / "2026-03-03_c_3.json.tmp").write_bytes(b'{"title": "Partial"}')
+    (tmp_path / "2026-03-04_d_4.json").write_bytes(b"not json")
+    (tmp_path / "2026-03-05_e_5.json").write_bytes(b'["not", "a", "dict"]')
+
+    articles = load_archived_articles(tmp_path, "2026-03")
+    assert [a["title"] for a in articles] == ["March A", "March B"]
+    assert articles[0]["_file"] == "2026-03-01_a_1.json"
+    assert load_archived_articles(tmp_path / "missing", "2026-03") == []
+
+
+def test_load_news_log_entries_filters_by_month(xdg_env):
+    """load_news_log_entries keeps only entries under headers in the target month."""
+    cfg = load_config()
+    cfg.log_path.parent.mkdir(parents=True, exist_ok=True)
+    cfg.log_path.write_text(
+        "\n".join([
+            "## 2026-02-27 (Automated Daily Scan)",
+            "### Old Source",
+            "- **[February article](https://example.com/feb)** (2026-02-27) — Old news",
+            "",
+            "## 2026-03-02 (Automated Daily Scan)",
+            "### New Source",
+            "- [★] **[March article](https://example.com/mar)** (2026-03-02) — Fresh signal",
+            "- **Plain March headline**",
+            "- **[Spaced article](https://example.com/nbsp)**\u00a0(2026-03-03)\u00a0— Wide gap",
+        ]) + "\n",
+        encoding="utf-8",
+    )
+    entries = load_news_log_entries(cfg.log_path, "2026-03")
+    assert [e["title"] for e in entries] == [
+        "March article",
+        "Plain March headline",
+        "Spaced article",
+    ]
+    assert entries[0]["source"] == "New Source"
+    assert entries[0]["link"] == "https://example.com/mar"
+    assert entries[0]["summary"] == "Fresh signal"
+    # Non-ASCII whitespace is matched like the str patterns would.
+    assert entries[2]["date"] == "2026-03-03"
+    assert entries[2]["summary"] == "Wide gap"
+
+
 def test_write_weekly_digest_creates_file_with_transcytose_section(tmp_path):
     """write_weekly_digest secretes transcytose section and per-source grouping."""
     output_path = tmp_path / "weekly-ai-digest-2026-W13.md"
@@ -3,17 +3,15 @@ from __future__ import annotations
 import json
 from types import SimpleNamespace
 
-import yaml
-
 from lustro.config import load_config
-from lustro.discover import _compile_keywords, matches_keywords, run_discover
+from lustro.discover import _combine_keywords, _compile_keywords, matches_keywords, run_discover
 
 
-def _write_sources_with_discovery(config_home):
+def _write_sources_with_discovery(config_home, dump_yaml):
     sources_path = config_home / "lustro" / "sources.yaml"
     sources_path.parent.mkdir(parents=True, exist_ok=True)
     sources_path.write_text(
-        yaml.safe_dump(
+        dump_yaml(
             {
                 "x_accounts": [
                     {"handle": "@alice", "name": "Alice", "tier": 1},
@@ -28,15 +26,49 @@ def _write_sources_with_discovery(config_home):
     )
 
 
+_KEYWORDS = _compile_keywords([r"\bAI\b", r"\bagent"])
+
+
 def test_keyword_matching():
-    keywords = _compile_keywords([r"\bAI\b", r"\bagent"])
-    assert matches_keywords("This AI launch is huge", keywords) is True
-    assert matches_keywords("Nothing relevant here", keywords) is False
+    assert matches_keywords("This AI launch is huge", _KEYWORDS) is True
+    assert matches_keywords("Nothing relevant here", _KEYWORDS) is False
+    assert matches_keywords("This AI launch is huge", _compile_keywords([])) is False
+
+
+def test_keyword_matching_falls_back_to_each_pattern():
+    named = _compile_keywords(["(?P<w>AI)", "(?P<w>agent)", "([unclosed"])
+    assert matches_keywords("New agent framework", named) is True
+    assert matches_keywords("Nothing relevant here", named) is False
+    backrefs = _compile_keywords([r"(a)\1", r"(b)\1"])
+    assert matches_keywords("bb", backrefs) is True
+
+
+def test_combine_keywords_skips_invalid_patterns():
+    combined = _combine_keywords((r"\bAI\b", "([unclosed", r"\bagent"))
+    assert combined is not None
+    assert combined.search("New agent framework") is not None
+    assert combined.search("Nothing relevant here") is None
+    assert _combine_keywords(("([unclosed",)) is None
+
+
+def test_combine_keywords_scopes_inline_flags():
+    combined = _combine_keywords(("(?i)llm", "(?s)model.card", "agent.loop"))
+    assert combined is not None
+    assert combined.search("New LLM release") is not None
+    assert combined.search("model\ncard") is not None
+    assert combined.search("agent\nloop") is None
+
+
+def test_combine_keywords_refuses_groups():
+    assert _combine_keywords(("(?P<w>AI)", "(?P<w>agent)")) is None
+    assert _combine_keywords((r"(a)\1", r"(b)\1")) is None
 
 
-def test_run_discover_filters_tracked_handles_and_formats_output(monkeypatch, xdg_env, capsys):
+def test_run_discover_filters_tracked_handles_and_formats_output(
+    monkeypatch, xdg_env, dump_yaml, capsys
+):
     config_home, _, _ = xdg_env
-    _write_sources_with_discovery(config_home)
+    _write_sources_with_discovery(config_home, dump_yaml)
     cfg = load_config()
 
     tweets = [
@@ -62,13 +94,13 @@ def test_run_discover_filters_tracked_handles_and_formats_output(monkeypatch, xd
         },
     ]
 
-    monkeypatch.setattr("lustro.discover.shutil.which", lambda _name: "/usr/local/bin/bird")
+    monkeypatch.setattr("lustro.config.shutil.which", lambda _name: "/usr/local/bin/bird")
     monkeypatch.setattr(
         "lustro.discover.subprocess.run",
         lambda *_args, **_kwargs: SimpleNamespace(
             returncode=0,
-            stdout=json.dumps(tweets),
-            stderr="",
+            stdout=json.dumps(tweets).encode("utf-8"),
+            stderr=b"",
         ),
     )
 
@@ -85,17 +117,17 @@ def test_run_discover_filters_tracked_handles_and_formats_output(monkeypatch, xd
     assert "@bob (2 matches)" in log_text
 
 
-def test_cmd_discover_uses_count_override(monkeypatch, xdg_env):
+def test_cmd_discover_uses_count_override(monkeypatch, xdg_env, dump_yaml):
     config_home, _, _ = xdg_env
-    _write_sources_with_discovery(config_home)
+    _write_sources_with_discovery(config_home, dump_yaml)
     called = {}
     cfg = load_config()
 
-    monkeypatch.setattr("lustro.discover.shutil.which", lambda _name: "/usr/local/bin/bird")
+    monkeypatch.setattr("lustro.config.shutil.which", lambda _name: "/usr/local/bin/bird")
 
     def fake_run(cmd, **_kwargs):
         called["cmd"] = cmd
-        return SimpleNamespace(returncode=0, stdout="[]", stderr="")
+        return SimpleNamespace(returncode=0, stdout=b"[]", stderr=b"")
 
     monkeypatch.setattr("lustro.discover.subprocess.run", fake_run)
     exit_code = run_discover(cfg, count=20)
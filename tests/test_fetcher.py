@@ -4,7 +4,18 @@ import json
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
-from lustro.fetcher import archive_cargo, internalize_rss, internalize_web, internalize_x_account, internalize_x_bookmarks, unbookmark_tweets
+from lustro.fetcher import (
+    _cached_getaddrinfo,
+    _is_safe_url,
+    _parse_tweet_date,
+    archive_cargo,
+    archive_cargo_batch,
+    internalize_rss,
+    internalize_web,
+    internalize_x_account,
+    internalize_x_bookmarks,
+    unbookmark_tweets,
+)
 
 
 class Entry(dict):
@@ -15,6 +26,19 @@ class Entry(dict):
             raise AttributeError(name) from exc
 
 
+class PageResp:
+    status_code = 200
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def iter_content(self, _chunk_size):
+        yield self.body
+
+    def close(self):
+        return None
+
+
 def test_fetch_rss(monkeypatch):
     entries = [
         Entry(
@@ -43,6 +67,28 @@ def test_fetch_rss(monkeypatch):
     assert articles[0]["summary"] == "New summary sentence one"
 
 
+def test_fetch_rss_conditional_get(monkeypatch):
+    calls = []
+    responses = [
+        SimpleNamespace(entries=[], bozo=False, status=200, etag='"v1"', modified="Tue, 24 Feb"),
+        SimpleNamespace(bozo=False, status=304),
+    ]
+
+    def fake_parse(_url, request_headers, etag=None, modified=None):
+        calls.append((etag, modified))
+        return responses.pop(0)
+
+    monkeypatch.setattr("lustro.fetcher.feedparser.parse", fake_parse)
+    url = "https://example.com/feed.xml"
+    state: dict[str, str] = {}
+
+    assert internalize_rss(url, "2026-02-23", validators=state) == []
+    assert state == {f"_etag:{url}": '"v1"', f"_modified:{url}": "Tue, 24 Feb"}
+
+    assert internalize_rss(url, "2026-02-23", validators=state) == []
+    assert calls == [(None, None), ('"v1"', "Tue, 24 Feb")]
+
+
 def test_fetch_rss_dead_feed(monkeypatch):
     monkeypatch.setattr(
         "lustro.fetcher.feedparser.parse",
@@ -61,12 +107,18 @@ def test_fetch_web(monkeypatch):
     """
 
     class FakeResp:
-        text = html
+        encoding = "utf-8"
 
         def raise_for_status(self):
             return None
 
-    monkeypatch.setattr("lustro.fetcher.requests.get", lambda *args, **kwargs: FakeResp())
+        def iter_content(self, _chunk_size):
+            yield html.encode()
+
+        def close(self):
+            return None
+
+    monkeypatch.setattr("lustro.fetcher._SESSION.get", lambda *args, **kwargs: FakeResp())
 
     articles = internalize_web("https://example.com")
 
@@ -80,8 +132,11 @@ def test_archive_cargo(monkeypatch, tmp_path):
         "This is the full text body of a substantial article about recent advances "
         "in artificial intelligence research and its implications for the industry."
     )
-    monkeypatch.setattr("lustro.fetcher.trafilatura.fetch_url", lambda _url: "raw-page")
-    monkeypatch.setattr("lustro.fetcher.trafilatura.extract", lambda _raw: full_text)
+    monkeypatch.setattr(
+        "lustro.fetcher._SESSION.get",
+        lambda *_args, **_kwargs: PageResp(b"raw-page"),
+    )
+    monkeypatch.setattr("trafilatura.extract", lambda _raw, **_kwargs: full_text)
 
     article = {
         "title": "A New Discovery in AI",
@@ -101,6 +156,39 @@ def test_archive_cargo(monkeypatch, tmp_path):
     assert payload["fetched_at"] == now.isoformat()
 
 
+def test_archive_cargo_batch(monkeypatch, tmp_path):
+    downloads = []
+
+    def fake_get(url, **_kwargs):
+        downloads.append(url)
+        return PageResp(url.encode())
+
+    monkeypatch.setattr("lustro.fetcher._cached_getaddrinfo", lambda _host: ("93.184.216.34",))
+    monkeypatch.setattr("lustro.fetcher._SESSION.get", fake_get)
+    monkeypatch.setattr(
+        "trafilatura.extract",
+        lambda raw, **_kwargs: f"Full article text for {raw.decode()} " * 5,
+    )
+    now = datetime(2026, 2, 24, 12, 30, tzinfo=timezone.utc)
+    jobs = [
+        (
+            {"title": f"Article number {i}", "date": "2026-02-24", "link": f"https://example.com/{i}"},
+            "Example Source",
+            1,
+        )
+        for i in range(5)
+    ]
+
+    # The repeated first job maps to the same archive file and is downloaded once.
+    archive_cargo_batch(jobs + jobs[:1], tmp_path / "articles", now)
+    assert len(list((tmp_path / "articles").glob("*.json"))) == 5
+    assert sorted(downloads) == sorted(article["link"] for article, _, _ in jobs)
+
+    # A second pass finds every file already archived and downloads nothing.
+    archive_cargo_batch(jobs, tmp_path / "articles", now)
+    assert len(downloads) == 5
+
+
 def test_fetch_x_account(monkeypatch):
     monkeypatch.setattr("lustro.fetcher.shutil.which", lambda _name: "/usr/local/bin/bird")
 
@@ -162,6 +250,13 @@ def test_fetch_x_bookmarks(monkeypatch):
     assert articles[0]["_tweet_id"] == "333"
 
 
+def test_parse_tweet_date():
+    assert _parse_tweet_date("Wed Feb 25 14:00:00 +0000 2026") == "2026-02-25"
+    assert _parse_tweet_date("Mon Feb 30 14:00:00 +0000 2026") == ""
+    assert _parse_tweet_date("Xyz Feb 25 14:00:00 +0000 2026") == ""
+    assert _parse_tweet_date(None) == ""
+
+
 def test_unbookmark_tweets(monkeypatch):
     monkeypatch.setattr("lustro.fetcher.shutil.which", lambda _name: "/usr/local/bin/bird")
 
@@ -192,8 +287,27 @@ def test_check_sources_zeros(monkeypatch, capsys):
         def close(self):
             pass
 
-    monkeypatch.setattr("lustro.fetcher.requests.get", lambda *args, **kwargs: FakeResp())
+    monkeypatch.setattr("lustro.fetcher._SESSION.get", lambda *args, **kwargs: FakeResp())
 
     check_receptors(sources, [], state, now=now)
     stderr = capsys.readouterr().err
     assert "(3x0)" in stderr
+
+
+def test_is_safe_url_caches_dns(monkeypatch):
+    calls = []
+
+    def fake_getaddrinfo(host, *_args):
+        calls.append(host)
+        ip = "10.0.0.5" if host == "intranet.example.com" else "93.184.216.34"
+        return [(2, 1, 6, "", (ip, 0))]
+
+    monkeypatch.setattr("lustro.fetcher.socket.getaddrinfo", fake_getaddrinfo)
+    _cached_getaddrinfo.cache_clear()
+    try:
+        assert _is_safe_url("https://cached.example.com/a") is True
+        assert _is_safe_url("https://cached.example.com/b") is True
+        assert _is_safe_url("http://intranet.example.com/") is False
+        assert calls == ["cached.example.com", "intranet.example.com"]
+    finally:
+        _cached_getaddrinfo.cache_clear()
@@ -66,7 +66,7 @@ def test_format_markdown_high_relevance_marker():
 
 def test_append_to_log_with_marker(tmp_path):
     log_path = tmp_path / "news.md"
-    log_path.write_text("# Header\n\n<!-- News entries below -->\n", encoding="utf-8")
+    log_path.write_bytes(b"# Header\n\n<!-- News entries below -->\n")
 
     append_to_log(log_path, "## 2026-02-24 (Automated Daily Scan)")
 
@@ -76,7 +76,7 @@ def test_append_to_log_with_marker(tmp_path):
 
 def test_append_to_log_without_marker(tmp_path):
     log_path = tmp_path / "news.md"
-    log_path.write_text("# Header\n", encoding="utf-8")
+    log_path.write_bytes(b"# Header\n")
 
     append_to_log(log_path, "## 2026-02-24 (Automated Daily Scan)")
 
@@ -84,11 +84,8 @@ def test_append_to_log_without_marker(tmp_path):
     assert content.endswith("\n\n## 2026-02-24 (Automated Daily Scan)")
 
 
-def test_rotate_log(tmp_path):
-    log_path = tmp_path / "AI News Log.md"
-    archive_dir = tmp_path / "archive"
-
-    content = "\n".join(
+_ROTATE_LOG_BYTES = (
+    "\n".join(
         [
             "# AI News Log",
             "<!-- News entries below -->",
@@ -98,7 +95,14 @@ def test_rotate_log(tmp_path):
             "- older",
         ]
     )
-    log_path.write_text(content + "\n", encoding="utf-8")
+    + "\n"
+).encode("utf-8")
+
+
+def test_rotate_log(tmp_path):
+    log_path = tmp_path / "AI News Log.md"
+    archive_dir = tmp_path / "archive"
+    log_path.write_bytes(_ROTATE_LOG_BYTES)
 
     now = datetime(2026, 2, 24, 12, 0, tzinfo=timezone.utc)
     rotate_log(log_path, archive_dir, max_lines=4, now=now)
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
-from lustro.state import load_state, refractory_elapsed, save_state
+import pytest
+
+from lustro import state as state_mod
+from lustro.state import dumps_json, load_state, loads_json, refractory_elapsed, save_state
 
 
 def test_load_save_roundtrip(tmp_path, sample_state):
@@ -27,6 +30,32 @@ def test_save_state_atomic_write(tmp_path, monkeypatch, sample_state):
     assert state_path.exists()
 
 
+@pytest.mark.parametrize(("env", "expected_calls"), [(None, 1), ("0", 0)])
+def test_save_state_fsync_toggle(tmp_path, monkeypatch, sample_state, env, expected_calls):
+    if env is None:
+        monkeypatch.delenv("LUSTRO_FSYNC", raising=False)
+    else:
+        monkeypatch.setenv("LUSTRO_FSYNC", env)
+    calls: list[int] = []
+    monkeypatch.setattr("lustro.state.os.fsync", calls.append)
+    save_state(tmp_path / "state.json", sample_state)
+    assert len(calls) == expected_calls
+    assert load_state(tmp_path / "state.json") == sample_state
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_shim_roundtrip(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(state_mod, "orjson", None)
+    elif state_mod.orjson is None:
+        pytest.skip("orjson not installed")
+    payload = {"seen_ids": ["b", "a"], "title": "量子位", "alerts_today": 1}
+    raw = dumps_json(payload, indent=True, sort_keys=True)
+    assert isinstance(raw, bytes)
+    assert raw.startswith(b'{\n  "alerts_today": 1,')
+    assert loads_json(raw) == payload
+
+
 def test_should_fetch_by_cadence():
     now = datetime(2026, 2, 24, 12, 0, tzinfo=timezone.utc)
     old = (now - timedelta(days=8)).isoformat()